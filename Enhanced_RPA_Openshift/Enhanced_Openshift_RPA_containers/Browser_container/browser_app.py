@@ -16,7 +16,9 @@ from middleware.auth import verify_service_token, auth_service
 from models.requests import (
     CreateSessionRequest, NavigateRequest, ClickRequest, FillRequest,
     TOTPRequest, GetTextRequest, GetAttributeRequest, WaitForSelectorRequest,
-    ScreenshotRequest, EvaluateRequest, SessionResponse, OperationResponse,
+    ScreenshotRequest, EvaluateRequest, WaitForUrlRequest, WaitForLoadStateRequest, WaitAnyRequest,
+    SetCookiesRequest, SessionResponse, OperationResponse, PageResponse, CookiesResponse,
+    WaitAnyResponse,
     TextResponse, AttributeResponse, SessionInfoResponse, HealthResponse,
     ErrorResponse
 )
@@ -54,11 +56,19 @@ async def lifespan(app: FastAPI):
     # Initialize browser manager
     try:
         browser_manager = BrowserManager()
-        await browser_manager.initialize(
-            browser_type='firefox',  # Fixed: Only Firefox is used
-            **Config.get_browser_launch_options()
-        )
-        logger.info("Browser manager initialized with Firefox (incognito mode)")
+        if Config.CDP_URL:
+            # Shared Chromium: each session gets its own context on it
+            await browser_manager.initialize(
+                browser_type='chromium',
+                cdp_url=Config.CDP_URL
+            )
+            logger.info(f"Browser manager connected to shared Chromium at {Config.CDP_URL}")
+        else:
+            await browser_manager.initialize(
+                browser_type='firefox',  # Fixed: Only Firefox is used
+                **Config.get_browser_launch_options()
+            )
+            logger.info("Browser manager initialized with Firefox (incognito mode)")
     except Exception as e:
         logger.error(f"Failed to initialize browser manager: {e}")
         raise
@@ -241,6 +251,119 @@ async def get_session_info(token: dict = Depends(verify_service_token)):
     return SessionInfoResponse(**session_info)
 
 
+@app.post("/browser/{session_id}/pages", response_model=PageResponse)
+async def new_page(
+    session_id: str,
+    token: dict = Depends(verify_service_token)
+):
+    """
+    Open an extra tab in a session. The tab shares the session's login.
+    """
+    try:
+        page_id = await browser_manager.new_page(session_id)
+        
+        return PageResponse(page_id=page_id, session_id=session_id)
+    except Exception as e:
+        logger.error(f"Failed to open tab: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to open tab: {str(e)}"
+        )
+
+
+@app.delete("/browser/page/{page_id}", response_model=OperationResponse)
+async def close_page(
+    page_id: str,
+    token: dict = Depends(verify_service_token)
+):
+    """
+    Close an extra tab.
+    """
+    try:
+        await browser_manager.close_page(page_id)
+        
+        return OperationResponse(
+            status="success",
+            message="Tab closed successfully",
+            details={"page_id": page_id}
+        )
+    except Exception as e:
+        logger.error(f"Failed to close tab: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to close tab: {str(e)}"
+        )
+
+
+@app.post("/browser/page/{page_id}/promote", response_model=OperationResponse)
+async def promote_page(
+    page_id: str,
+    token: dict = Depends(verify_service_token)
+):
+    """
+    Make an extra tab its session's main page, closing the old one.
+    """
+    try:
+        session_id = await browser_manager.promote_page(page_id)
+        
+        return OperationResponse(
+            status="success",
+            message="Tab promoted to main page",
+            details={"page_id": page_id, "session_id": session_id}
+        )
+    except Exception as e:
+        logger.error(f"Failed to promote tab: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to promote tab: {str(e)}"
+        )
+
+
+@app.get("/browser/{session_id}/cookies", response_model=CookiesResponse)
+async def get_cookies(
+    session_id: str,
+    token: dict = Depends(verify_service_token)
+):
+    """
+    Get all cookies of a session's browser context.
+    """
+    try:
+        cookies = await browser_manager.get_cookies(session_id)
+        
+        return CookiesResponse(cookies=cookies)
+    except Exception as e:
+        logger.error(f"Get cookies failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get cookies: {str(e)}"
+        )
+
+
+@app.post("/browser/{session_id}/cookies", response_model=OperationResponse)
+async def set_cookies(
+    session_id: str,
+    request: SetCookiesRequest,
+    token: dict = Depends(verify_service_token)
+):
+    """
+    Add cookies to a session's browser context.
+    """
+    try:
+        await browser_manager.set_cookies(session_id, request.cookies)
+        
+        return OperationResponse(
+            status="success",
+            message=f"Added {len(request.cookies)} cookies",
+            details={"count": len(request.cookies)}
+        )
+    except Exception as e:
+        logger.error(f"Set cookies failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to set cookies: {str(e)}"
+        )
+
+
 # Browser Navigation Endpoints
 @app.post("/browser/navigate", response_model=OperationResponse)
 async def navigate(
@@ -423,16 +546,20 @@ async def screenshot(
 ):
     """
     Capture screenshot.
-    Returns PNG image bytes.
+    Returns PNG or JPEG image bytes.
     """
     try:
-        image_bytes = await browser_manager.screenshot(full_page=request.full_page)
+        image_bytes = await browser_manager.screenshot(
+            full_page=request.full_page,
+            image_type=request.type.value,
+            quality=request.quality
+        )
         
         logger.info(f"Screenshot captured for {token.get('sub')}")
         
         return Response(
             content=image_bytes,
-            media_type="image/png"
+            media_type=f"image/{request.type.value}"
         )
     except Exception as e:
         logger.error(f"Screenshot failed: {e}")
@@ -471,6 +598,90 @@ async def wait_for_selector(
         )
 
 
+@app.post("/browser/{session_id}/wait_any", response_model=WaitAnyResponse)
+async def wait_any(
+    session_id: str,
+    request: WaitAnyRequest,
+    token: dict = Depends(verify_service_token)
+):
+    """
+    Wait for whichever of several elements becomes visible first.
+    A timeout is not an error: the index is -1.
+    """
+    try:
+        index = await browser_manager.wait_any(
+            session_id,
+            selectors=request.selectors,
+            timeout=request.timeout * 1000
+        )
+        
+        return WaitAnyResponse(index=index)
+    except Exception as e:
+        logger.error(f"Wait any failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Wait any failed: {str(e)}"
+        )
+
+
+@app.post("/browser/{session_id}/wait_url", response_model=OperationResponse)
+async def wait_for_url(
+    session_id: str,
+    request: WaitForUrlRequest,
+    token: dict = Depends(verify_service_token)
+):
+    """
+    Wait for the session's page URL to match a URL or glob pattern.
+    """
+    try:
+        await browser_manager.wait_for_url(
+            session_id,
+            url=request.url,
+            timeout=request.timeout * 1000
+        )
+        
+        return OperationResponse(
+            status="success",
+            message=f"Page reached URL: {request.url}",
+            details={"url": request.url}
+        )
+    except Exception as e:
+        logger.error(f"Wait for URL failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Wait for URL failed: {str(e)}"
+        )
+
+
+@app.post("/browser/{session_id}/wait_load_state", response_model=OperationResponse)
+async def wait_for_load_state(
+    session_id: str,
+    request: WaitForLoadStateRequest,
+    token: dict = Depends(verify_service_token)
+):
+    """
+    Wait for the session's page to reach a load state.
+    """
+    try:
+        await browser_manager.wait_for_load_state(
+            session_id,
+            state=request.state.value,
+            timeout=request.timeout * 1000
+        )
+        
+        return OperationResponse(
+            status="success",
+            message=f"Page reached load state: {request.state.value}",
+            details={"state": request.state.value}
+        )
+    except Exception as e:
+        logger.error(f"Wait for load state failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Wait for load state failed: {str(e)}"
+        )
+
+
 # JavaScript Evaluation
 @app.post("/browser/evaluate", response_model=OperationResponse)
 async def evaluate(
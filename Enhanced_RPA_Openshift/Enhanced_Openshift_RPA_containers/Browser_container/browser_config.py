@@ -17,6 +17,7 @@ class Config:
     
     # Browser Configuration
     BROWSER_TYPE = 'firefox'  # Fixed: Only Firefox is used
+    CDP_URL = os.getenv('BROWSER_CDP_URL')  # Shared Chromium to connect to, e.g. ws://browser-svc:9222
     HEADLESS = os.getenv('HEADLESS', 'true').lower() == 'true'
     
     # Session Configuration
@@ -90,6 +91,7 @@ class Config:
             'host': cls.HOST,
             'port': cls.PORT,
             'browser_type': cls.BROWSER_TYPE,
+            'cdp_url': cls.CDP_URL,
             'headless': cls.HEADLESS,
             'default_timeout': cls.DEFAULT_TIMEOUT,
             'max_sessions': cls.MAX_SESSIONS,
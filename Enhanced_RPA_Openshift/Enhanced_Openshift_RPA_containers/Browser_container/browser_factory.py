@@ -23,6 +23,12 @@ class BrowserInterface(ABC):
     def get_browser_type(self) -> str:
         """Get browser type name"""
         pass
+    
+    async def connect(self, endpoint: str) -> Browser:
+        """Connect to an already running browser"""
+        raise NotImplementedError(
+            f"{self.get_browser_type()} does not support connecting to a running browser"
+        )
 
 
 class FirefoxBrowser(BrowserInterface):
@@ -76,6 +82,13 @@ class ChromiumBrowser(BrowserInterface):
         logger.info("Chromium browser launched successfully")
         return browser
     
+    async def connect(self, endpoint: str) -> Browser:
+        """Connect to a shared Chromium over the Chrome DevTools Protocol"""
+        logger.info(f"Connecting to Chromium over CDP at {endpoint}")
+        browser = await self.browser_type.connect_over_cdp(endpoint)
+        logger.info("Connected to shared Chromium browser")
+        return browser
+    
     def get_browser_type(self) -> str:
         return "chromium"
 
@@ -102,6 +115,7 @@ class BrowserFactory:
     async def create_browser(
         self, 
         browser_type: str = 'firefox',
+        cdp_url: Optional[str] = None,
         **launch_options
     ) -> tuple[BrowserInterface, Browser]:
         """
@@ -109,6 +123,7 @@ class BrowserFactory:
         
         Args:
             browser_type: Type of browser ('firefox', 'chromium')
+            cdp_url: Connect to this running browser instead of launching one
             **launch_options: Additional browser launch options
             
         Returns:
@@ -127,7 +142,10 @@ class BrowserFactory:
         
         browser_class = self._browsers[browser_type]
         browser_interface = browser_class(self.playwright)
-        browser_instance = await browser_interface.launch(**launch_options)
+        if cdp_url:
+            browser_instance = await browser_interface.connect(cdp_url)
+        else:
+            browser_instance = await browser_interface.launch(**launch_options)
         
         logger.info(f"Created {browser_type} browser via factory")
         return browser_interface, browser_instance
@@ -5,7 +5,7 @@ Manages browser lifecycle and operations using factories.
 """
 import uuid
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from playwright.async_api import Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeout
 
 from factories.browser_factory import BrowserFactory, BrowserInterface
@@ -40,18 +40,21 @@ class BrowserManager:
         self._initialized = True
         self._ready = False
     
-    async def initialize(self, browser_type: str = 'firefox', **launch_options):
+    async def initialize(self, browser_type: str = 'firefox', cdp_url: Optional[str] = None,
+                         **launch_options):
         """
         Initialize browser using factory
         
         Args:
             browser_type: Type of browser to create
+            cdp_url: CDP endpoint of a shared browser to connect to instead of launching
             **launch_options: Browser launch options
         """
         try:
-            # Create browser via factory
+            # Create browser via factory; sessions become contexts on the shared browser
             self.browser_interface, self.browser = await self.browser_factory.create_browser(
                 browser_type=browser_type,
+                cdp_url=cdp_url,
                 **launch_options
             )
             
@@ -115,6 +118,46 @@ class BrowserManager:
         _, page = session
         return page
     
+    async def get_session_page(self, session_id: str) -> Page:
+        """Get the page of a session addressed by id"""
+        session = await self.session_factory.get_session(session_id)
+        if not session:
+            raise RuntimeError(f"Session {session_id} not found")
+        
+        _, page = session
+        return page
+    
+    async def new_page(self, session_id: str) -> str:
+        """Open an extra tab in a session; returns its page_id"""
+        return await self.session_factory.open_page(session_id)
+    
+    async def close_page(self, page_id: str):
+        """Close an extra tab"""
+        await self.session_factory.close_page(page_id)
+    
+    async def promote_page(self, page_id: str) -> str:
+        """Make an extra tab its session's main page; returns the session_id"""
+        return await self.session_factory.promote_page(page_id)
+    
+    async def get_cookies(self, session_id: str) -> List[Dict[str, Any]]:
+        """Get all cookies of a session's browser context"""
+        session = await self.session_factory.get_session(session_id)
+        if not session:
+            raise RuntimeError(f"Session {session_id} not found")
+        
+        context, _ = session
+        return await context.cookies()
+    
+    async def set_cookies(self, session_id: str, cookies: List[Dict[str, Any]]):
+        """Add cookies to a session's browser context"""
+        session = await self.session_factory.get_session(session_id)
+        if not session:
+            raise RuntimeError(f"Session {session_id} not found")
+        
+        context, _ = session
+        await context.add_cookies(cookies)
+        logger.info(f"Added {len(cookies)} cookies to session {session_id}")
+    
     async def navigate(
         self,
         url: str,
@@ -237,7 +280,9 @@ class BrowserManager:
     async def screenshot(
         self,
         full_page: bool = False,
-        path: Optional[str] = None
+        path: Optional[str] = None,
+        image_type: str = 'png',
+        quality: Optional[int] = None
     ) -> bytes:
         """
         Capture screenshot
@@ -245,12 +290,17 @@ class BrowserManager:
         Args:
             full_page: Capture full scrollable page
             path: Optional path to save screenshot
+            image_type: Image format ('png', 'jpeg')
+            quality: JPEG quality 0-100 (not accepted for PNG)
             
         Returns:
             Screenshot bytes
         """
         page = await self.get_current_page()
-        screenshot_bytes = await page.screenshot(full_page=full_page, path=path)
+        options: Dict[str, Any] = {'full_page': full_page, 'path': path, 'type': image_type}
+        if image_type == 'jpeg' and quality is not None:
+            options['quality'] = quality
+        screenshot_bytes = await page.screenshot(**options)
         logger.info("Captured screenshot")
         return screenshot_bytes
     
@@ -277,6 +327,94 @@ class BrowserManager:
             logger.error(f"Timeout waiting for {selector} to be {state}")
             raise
     
+    async def wait_any(
+        self,
+        session_id: str,
+        selectors: List[str],
+        timeout: int = 30000
+    ) -> int:
+        """
+        Wait for whichever of several elements becomes visible first
+        
+        Args:
+            session_id: Session ID
+            selectors: Candidate selectors, in priority order
+            timeout: Timeout in milliseconds
+            
+        Returns:
+            Index of the first visible selector (else the first still attached once
+            one has appeared), or -1 if none appeared in time
+        """
+        page = await self.get_session_page(session_id)
+        locators = [page.locator(selector) for selector in selectors]
+        
+        combined = locators[0]
+        for locator in locators[1:]:
+            combined = combined.or_(locator)
+        
+        try:
+            await combined.first.wait_for(state='visible', timeout=timeout)
+        except PlaywrightTimeout:
+            logger.info(f"None of {len(selectors)} selectors appeared")
+            return -1
+        
+        for index, locator in enumerate(locators):
+            if await locator.first.is_visible():
+                return index
+        
+        # The matched element re-rendered or hid after the wait resolved -
+        # fall back to the first selector still present in the DOM
+        for index, locator in enumerate(locators):
+            if await locator.count() > 0:
+                return index
+        return -1
+    
+    async def wait_for_url(
+        self,
+        session_id: str,
+        url: str,
+        timeout: int = 30000
+    ):
+        """
+        Wait for a session's page URL to match
+        
+        Args:
+            session_id: Session ID
+            url: URL, glob pattern or regex
+            timeout: Timeout in milliseconds
+        """
+        page = await self.get_session_page(session_id)
+        
+        try:
+            await page.wait_for_url(url, timeout=timeout)
+            logger.info(f"Session {session_id} reached URL: {url}")
+        except PlaywrightTimeout:
+            logger.error(f"Timeout waiting for URL {url}")
+            raise
+    
+    async def wait_for_load_state(
+        self,
+        session_id: str,
+        state: str = 'networkidle',
+        timeout: int = 30000
+    ):
+        """
+        Wait for a session's page to reach a load state
+        
+        Args:
+            session_id: Session ID
+            state: Load state ('load', 'domcontentloaded', 'networkidle')
+            timeout: Timeout in milliseconds
+        """
+        page = await self.get_session_page(session_id)
+        
+        try:
+            await page.wait_for_load_state(state, timeout=timeout)
+            logger.info(f"Session {session_id} reached load state: {state}")
+        except PlaywrightTimeout:
+            logger.error(f"Timeout waiting for load state {state}")
+            raise
+    
     async def evaluate(self, expression: str) -> Any:
         """Execute JavaScript in page context"""
         page = await self.get_current_page()
@@ -310,6 +448,7 @@ class BrowserManager:
             await self.session_factory.close_all_sessions()
         
         if self.browser:
+            # For a CDP-connected browser this only drops our contexts and disconnects
             await self.browser.close()
             logger.info("Browser closed")
         
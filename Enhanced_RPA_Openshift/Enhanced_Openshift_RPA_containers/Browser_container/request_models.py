@@ -22,6 +22,12 @@ class SessionTypeEnum(str, Enum):
     INCOGNITO = 'incognito'
 
 
+class ImageTypeEnum(str, Enum):
+    """Screenshot image formats"""
+    PNG = 'png'
+    JPEG = 'jpeg'
+
+
 class ElementStateEnum(str, Enum):
     """Element states"""
     ATTACHED = 'attached'
@@ -181,11 +187,15 @@ class WaitForSelectorRequest(BaseModel):
 class ScreenshotRequest(BaseModel):
     """Request to capture screenshot"""
     full_page: bool = Field(default=False, description="Capture full scrollable page")
+    type: ImageTypeEnum = Field(default=ImageTypeEnum.PNG, description="Image format")
+    quality: Optional[int] = Field(default=None, ge=0, le=100, description="JPEG quality (ignored for PNG)")
     
     class Config:
         schema_extra = {
             "example": {
-                "full_page": True
+                "full_page": True,
+                "type": "jpeg",
+                "quality": 70
             }
         }
 
@@ -202,6 +212,57 @@ class EvaluateRequest(BaseModel):
         }
 
 
+# Session-addressed requests (worker BrowserServiceClient); timeouts are in seconds
+class WaitForUrlRequest(BaseModel):
+    """Request to wait for the page URL to match"""
+    url: str = Field(..., description="URL, glob pattern (e.g. **/main.php*) or regex")
+    timeout: int = Field(default=30, ge=1, le=120, description="Timeout in seconds")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "url": "**/main.php*",
+                "timeout": 30
+            }
+        }
+
+
+class WaitAnyRequest(BaseModel):
+    """Request to wait for whichever of several elements becomes visible first"""
+    selectors: List[str] = Field(..., min_length=1, description="Candidate selectors, in priority order")
+    timeout: int = Field(default=30, ge=1, le=120, description="Timeout in seconds")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "selectors": ["table.results", "text='No results found'"],
+                "timeout": 15
+            }
+        }
+
+
+class WaitForLoadStateRequest(BaseModel):
+    """Request to wait for the page to reach a load state"""
+    state: WaitUntilEnum = Field(
+        default=WaitUntilEnum.NETWORKIDLE,
+        description="Load state to wait for"
+    )
+    timeout: int = Field(default=30, ge=1, le=120, description="Timeout in seconds")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "state": "networkidle",
+                "timeout": 30
+            }
+        }
+
+
+class SetCookiesRequest(BaseModel):
+    """Request to add cookies to a session's browser context"""
+    cookies: List[Dict[str, Any]] = Field(..., description="Cookies as returned by the cookies endpoint")
+
+
 # Response Models
 class SessionResponse(BaseModel):
     """Response after creating session"""
@@ -218,6 +279,22 @@ class OperationResponse(BaseModel):
     details: Optional[Dict[str, Any]] = None
 
 
+class PageResponse(BaseModel):
+    """Response after opening an extra tab in a session"""
+    page_id: str
+    session_id: str
+
+
+class WaitAnyResponse(BaseModel):
+    """Response with the selector that appeared first"""
+    index: int = Field(..., description="Index of the visible selector, -1 if none appeared in time")
+
+
+class CookiesResponse(BaseModel):
+    """Response containing a session's cookies"""
+    cookies: List[Dict[str, Any]]
+
+
 class TextResponse(BaseModel):
     """Response containing text content"""
     text: str
@@ -3,6 +3,7 @@ Session Factory - Factory Pattern for Browser Session/Context Creation
 ----------------------------------------------------------------------
 Creates different browser contexts with various configurations.
 """
+import uuid
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from playwright.async_api import Browser, BrowserContext, Page
@@ -99,6 +100,8 @@ class SessionFactory:
         self.browser = browser
         self.active_contexts: Dict[str, BrowserContext] = {}
         self.active_pages: Dict[str, Page] = {}
+        # Extra tabs opened in a session: page_id -> (owning session_id, page)
+        self.extra_pages: Dict[str, tuple[str, Page]] = {}
     
     async def create_session(
         self,
@@ -152,13 +155,63 @@ class SessionFactory:
         return context, page
     
     async def get_session(self, session_id: str) -> Optional[tuple[BrowserContext, Page]]:
-        """Get an existing session"""
+        """Get an existing session, or the owning context and page of an extra tab"""
+        if session_id in self.extra_pages:
+            owner_id, page = self.extra_pages[session_id]
+            return self.active_contexts[owner_id], page
         if session_id not in self.active_contexts:
             return None
         return self.active_contexts[session_id], self.active_pages[session_id]
     
+    async def open_page(self, session_id: str) -> str:
+        """
+        Open an extra tab in a session's context
+        
+        The tab shares the session's cookies. Its page_id is accepted
+        anywhere a session_id is.
+        
+        Returns:
+            page_id of the new tab
+        """
+        if session_id not in self.active_contexts:
+            raise ValueError(f"Session {session_id} not found")
+        
+        page = await self.active_contexts[session_id].new_page()
+        page_id = str(uuid.uuid4())
+        self.extra_pages[page_id] = (session_id, page)
+        logger.info(f"Opened tab {page_id} in session {session_id}")
+        return page_id
+    
+    async def close_page(self, page_id: str):
+        """Close an extra tab"""
+        entry = self.extra_pages.pop(page_id, None)
+        if entry:
+            _, page = entry
+            await page.close()
+            logger.info(f"Closed tab {page_id}")
+    
+    async def promote_page(self, page_id: str) -> str:
+        """
+        Make an extra tab its session's main page, closing the old main page
+        
+        Returns:
+            The owning session_id, which now addresses the tab
+        """
+        if page_id not in self.extra_pages:
+            raise ValueError(f"Tab {page_id} not found")
+        
+        session_id, page = self.extra_pages.pop(page_id)
+        old_page = self.active_pages[session_id]
+        self.active_pages[session_id] = page
+        await old_page.close()
+        logger.info(f"Tab {page_id} is now the main page of session {session_id}")
+        return session_id
+    
     async def close_session(self, session_id: str):
         """Close a specific session"""
+        for page_id in [pid for pid, (owner, _) in self.extra_pages.items() if owner == session_id]:
+            await self.close_page(page_id)
+        
         if session_id in self.active_contexts:
             context = self.active_contexts[session_id]
             page = self.active_pages[session_id]
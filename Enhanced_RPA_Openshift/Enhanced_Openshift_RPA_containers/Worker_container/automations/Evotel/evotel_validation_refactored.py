@@ -9,15 +9,15 @@ import asyncio
 import time
 import logging
 import traceback
-import json
 import base64
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from enum import Enum
+from operator import attrgetter
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 
 # Import browser client
 from browser_client import BrowserServiceClient
@@ -60,18 +60,17 @@ class ServiceStatus(str, Enum):
 
 class ValidationRequest(BaseModel):
     """Input model for validation requests"""
-    job_id: str = Field(..., description="Unique job identifier")
-    circuit_number: str = Field(..., description="Circuit number to validate")
+    job_id: str
+    circuit_number: str
 
 class ScreenshotData(BaseModel):
     """Screenshot metadata and data container"""
+    model_config = ConfigDict(json_encoders={datetime: lambda v: v.isoformat()})
+
     name: str
     timestamp: datetime
     data: str  # Base64 encoded image
     path: str
-    
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
 
 class ServiceData(BaseModel):
     """Service information container"""
@@ -146,6 +145,10 @@ class ScreenshotService:
 
 # ==================== UTILITY FUNCTIONS ====================
 
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (second precision)"""
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
 async def robust_click(browser: BrowserServiceClient, session_id: str, 
                       selector: str, description: str = "element") -> bool:
     """Multi-method element clicking with fallback strategies"""
@@ -174,6 +177,91 @@ async def robust_click(browser: BrowserServiceClient, session_id: str,
     
     return False
 
+SERVICE_LINK_SELECTOR = "#WebGrid tbody tr td:nth-child(3) a"
+
+# Polls for the search result links inside the page and returns the count plus
+# the per-link metadata used for active/greyed-out classification in one call.
+SEARCH_RESULTS_SCRIPT = """
+return new Promise((resolve) => {
+    const deadline = Date.now() + 3000;
+    const collect = () => {
+        const links = Array.from(document.querySelectorAll('%s'));
+        if (links.length === 0 && Date.now() < deadline) {
+            setTimeout(collect, 100);
+            return;
+        }
+        resolve({
+            count: links.length,
+            links: links.map((link, index) => ({
+                index: index,
+                text: link.textContent.trim(),
+                href: link.href || '',
+                style: link.getAttribute('style') || '',
+                classes: link.className || '',
+                enabled: link.disabled === false,
+                opacity: window.getComputedStyle(link).opacity,
+                color: window.getComputedStyle(link).color
+            }))
+        });
+    };
+    collect();
+});
+""" % SERVICE_LINK_SELECTOR
+
+def classify_service_links(all_links: List[Dict], logger) -> List[Dict]:
+    """
+    Filter raw service link metadata down to active (non-greyed) links
+    Returns list of dicts with selector and text
+    """
+    active_links = []
+    
+    for link_info in all_links:
+        # Check href validity
+        href = link_info.get('href', '')
+        if not href or href in ["#", "javascript:void(0)", "javascript:;"]:
+            logger.info(f"Link {link_info['index']+1}: Skipping - invalid href")
+            continue
+        
+        # Check for disabled classes
+        classes = link_info.get('classes', '').lower()
+        if any(cls in classes for cls in ['disabled', 'inactive', 'text-muted', 'greyed-out']):
+            logger.info(f"Link {link_info['index']+1}: Skipping - has disabled class")
+            continue
+        
+        # Check inline style for gray colors
+        style = link_info.get('style', '').lower()
+        gray_colors = ['#c0c0c0', '#cccccc', '#999999', '#666666', '#808080']
+        if any(gray in style for gray in gray_colors):
+            logger.info(f"Link {link_info['index']+1}: Skipping - has gray inline style")
+            continue
+        
+        # Check computed color (RGB check)
+        color = link_info.get('color', '')
+        if color:
+            rgb_match = re.search(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', color)
+            if rgb_match:
+                r, g, b = map(int, rgb_match.groups())
+                if abs(r - g) < 50 and abs(g - b) < 50 and max(r, g, b) < 150:
+                    logger.info(f"Link {link_info['index']+1}: Skipping - greyed out color")
+                    continue
+        
+        # Check opacity
+        opacity = float(link_info.get('opacity', 1))
+        if opacity < 0.6:
+            logger.info(f"Link {link_info['index']+1}: Skipping - low opacity")
+            continue
+        
+        # Link is active
+        logger.info(f"Link {link_info['index']+1}: Active - '{link_info['text']}'")
+        active_links.append({
+            'selector': f"{SERVICE_LINK_SELECTOR}:nth-of-type({link_info['index']+1})",
+            'text': link_info['text'],
+            'href': href
+        })
+    
+    logger.info(f"Found {len(active_links)} active links out of {len(all_links)} total")
+    return active_links
+
 async def filter_active_service_links(browser: BrowserServiceClient, 
                                      session_id: str, logger) -> List[Dict]:
     """
@@ -181,77 +269,14 @@ async def filter_active_service_links(browser: BrowserServiceClient,
     Returns list of dicts with selector and text
     """
     try:
-        # Get all service link elements
-        script = """
-        const links = Array.from(document.querySelectorAll('#WebGrid tbody tr td:nth-child(3) a'));
-        return links.map((link, index) => ({
-            index: index,
-            text: link.textContent.trim(),
-            href: link.href || '',
-            style: link.getAttribute('style') || '',
-            classes: link.className || '',
-            enabled: link.disabled === false,
-            opacity: window.getComputedStyle(link).opacity,
-            color: window.getComputedStyle(link).color
-        }));
-        """
-        
-        all_links = await browser.execute_script(session_id, script)
+        payload = await browser.execute_script(session_id, SEARCH_RESULTS_SCRIPT)
+        all_links = (payload or {}).get('links', [])
         
         if not all_links:
             logger.warning("No service links found")
             return []
         
-        active_links = []
-        
-        for link_info in all_links:
-            is_active = True
-            
-            # Check href validity
-            href = link_info.get('href', '')
-            if not href or href in ["#", "javascript:void(0)", "javascript:;"]:
-                logger.info(f"Link {link_info['index']+1}: Skipping - invalid href")
-                continue
-            
-            # Check for disabled classes
-            classes = link_info.get('classes', '').lower()
-            if any(cls in classes for cls in ['disabled', 'inactive', 'text-muted', 'greyed-out']):
-                logger.info(f"Link {link_info['index']+1}: Skipping - has disabled class")
-                continue
-            
-            # Check inline style for gray colors
-            style = link_info.get('style', '').lower()
-            gray_colors = ['#c0c0c0', '#cccccc', '#999999', '#666666', '#808080']
-            if any(gray in style for gray in gray_colors):
-                logger.info(f"Link {link_info['index']+1}: Skipping - has gray inline style")
-                continue
-            
-            # Check computed color (RGB check)
-            color = link_info.get('color', '')
-            if color:
-                rgb_match = re.search(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', color)
-                if rgb_match:
-                    r, g, b = map(int, rgb_match.groups())
-                    if abs(r - g) < 50 and abs(g - b) < 50 and max(r, g, b) < 150:
-                        logger.info(f"Link {link_info['index']+1}: Skipping - greyed out color")
-                        continue
-            
-            # Check opacity
-            opacity = float(link_info.get('opacity', 1))
-            if opacity < 0.6:
-                logger.info(f"Link {link_info['index']+1}: Skipping - low opacity")
-                continue
-            
-            # Link is active
-            logger.info(f"Link {link_info['index']+1}: Active - '{link_info['text']}'")
-            active_links.append({
-                'selector': f"#WebGrid tbody tr td:nth-child(3) a:nth-of-type({link_info['index']+1})",
-                'text': link_info['text'],
-                'href': href
-            })
-        
-        logger.info(f"Found {len(active_links)} active links out of {len(all_links)} total")
-        return active_links
+        return classify_service_links(all_links, logger)
         
     except Exception as e:
         logger.error(f"Error filtering active service links: {e}")
@@ -384,6 +409,7 @@ class EvotelDataExtractor:
         self.browser = browser
         self.session_id = session_id
         self.logger = logger
+        self._last_links_payload: Optional[Dict[str, Any]] = None
     
     async def search_circuit_number(self, circuit_number: str) -> SearchResult:
         """Search for circuit number in Evotel portal"""
@@ -408,8 +434,10 @@ class EvotelDataExtractor:
             await self.browser.click(self.session_id, "#btnSearch")
             self.logger.info("Search button clicked")
             
-            # Wait for results
-            await asyncio.sleep(3)
+            # Wait for results and capture the service links in one round-trip
+            self._last_links_payload = await self.browser.execute_script(
+                self.session_id, SEARCH_RESULTS_SCRIPT
+            )
             
             return await self._check_search_results()
             
@@ -421,12 +449,7 @@ class EvotelDataExtractor:
         """Check if search returned results"""
         try:
             # Check for service links
-            script = """
-            const links = document.querySelectorAll('#WebGrid tbody tr td:nth-child(3) a');
-            return links.length;
-            """
-            
-            link_count = await self.browser.execute_script(self.session_id, script)
+            link_count = (self._last_links_payload or {}).get('count', 0)
             
             if link_count and link_count > 0:
                 self.logger.info(f"Found {link_count} service results")
@@ -450,17 +473,17 @@ class EvotelDataExtractor:
         try:
             self.logger.info("Extracting active service information")
             
-            # Wait for service links
-            await self.browser.wait_for_selector(
-                self.session_id,
-                "#WebGrid tbody tr td:nth-child(3) a",
-                timeout=15
-            )
-            
-            # Get active service links
-            active_links = await filter_active_service_links(
-                self.browser, self.session_id, self.logger
-            )
+            # Get active service links, reusing the links captured by the search
+            payload, self._last_links_payload = self._last_links_payload, None
+            if payload and payload.get('links'):
+                active_links = classify_service_links(payload['links'], self.logger)
+            else:
+                await self.browser.wait_for_selector(
+                    self.session_id, SERVICE_LINK_SELECTOR, timeout=15
+                )
+                active_links = await filter_active_service_links(
+                    self.browser, self.session_id, self.logger
+                )
             
             if active_links:
                 # Use last active service
@@ -498,6 +521,7 @@ class EvotelDataExtractor:
         """Extract work orders - first (most recent) only"""
         try:
             self.logger.info("Extracting first work order")
+            extraction_timestamp = _now_iso()
             
             # Click work orders menu
             await self.browser.click(self.session_id, "#work-orders > span")
@@ -528,14 +552,16 @@ class EvotelDataExtractor:
             await asyncio.sleep(3)
             
             # Extract comprehensive data
-            comprehensive_details = await self._extract_comprehensive_work_order_details()
+            comprehensive_details = await self._extract_comprehensive_work_order_details(
+                extraction_timestamp
+            )
             
             return [{
                 "work_order_index": 1,
                 "work_order_text": first_wo['text'],
                 "work_order_url": first_wo['href'],
                 "comprehensive_details": comprehensive_details,
-                "extraction_timestamp": datetime.now().isoformat(),
+                "extraction_timestamp": extraction_timestamp,
                 "is_most_recent": True
             }]
             
@@ -543,12 +569,10 @@ class EvotelDataExtractor:
             self.logger.error(f"Error extracting work orders: {str(e)}")
             return []
     
-    async def _extract_comprehensive_work_order_details(self) -> Dict[str, Any]:
+    async def _extract_comprehensive_work_order_details(
+            self, extraction_timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Extract comprehensive work order details"""
         try:
-            # Get full page text
-            page_text = await self.browser.get_text(self.session_id, "body")
-            
             # Extract using JavaScript
             script = """
             const extractField = (labels) => {
@@ -584,12 +608,18 @@ class EvotelDataExtractor:
             };
             """
             
-            extracted_data = await self.browser.execute_script(self.session_id, script)
+            # Page text, field extraction and URL are independent reads of the
+            # same page state, so issue them concurrently
+            page_text, extracted_data, page_url = await asyncio.gather(
+                self.browser.get_text(self.session_id, "body"),
+                self.browser.execute_script(self.session_id, script),
+                self.browser.get_current_url(self.session_id)
+            )
             
             return {
                 "extraction_metadata": {
-                    "extraction_timestamp": datetime.now().isoformat(),
-                    "page_url": await self.browser.get_current_url(self.session_id),
+                    "extraction_timestamp": extraction_timestamp or _now_iso(),
+                    "page_url": page_url,
                     "full_page_text": page_text
                 },
                 **extracted_data
@@ -712,7 +742,7 @@ class EvotelValidationAutomation:
             status=ServiceStatus.ACTIVE,
             work_orders=work_orders,
             service_details=service_info,
-            extraction_timestamp=datetime.now().isoformat()
+            extraction_timestamp=_now_iso()
         )
         
         details = {
@@ -777,12 +807,17 @@ class EvotelValidationAutomation:
 
 # ==================== MAIN EXECUTION ====================
 
+# Configuration is fixed for the life of the process, so check it once
+_CONFIG_READY = bool(Config.EVOTEL_URL and Config.EVOTEL_EMAIL and Config.EVOTEL_PASSWORD)
+if not _CONFIG_READY:
+    logger.warning("Evotel configuration incomplete - validation jobs will be rejected")
+
 async def execute(parameters: Dict[str, Any], 
                  browser_client: BrowserServiceClient) -> Dict[str, Any]:
     """Main execution function for external API calls"""
     try:
         # Validate configuration
-        if not all([Config.EVOTEL_URL, Config.EVOTEL_EMAIL, Config.EVOTEL_PASSWORD]):
+        if not _CONFIG_READY:
             logger.error("Missing required Evotel configuration")
             return {
                 "status": "error",
@@ -803,21 +838,25 @@ async def execute(parameters: Dict[str, Any],
         automation = EvotelValidationAutomation(browser_client)
         result = await automation.validate_circuit_number(request)
         
+        # Convert screenshots to plain dicts
+        screenshot_fields = attrgetter('name', 'timestamp', 'data', 'path')
+        screenshot_data = [None] * len(result.screenshots)
+        for i, screenshot in enumerate(result.screenshots):
+            name, timestamp, data, path = screenshot_fields(screenshot)
+            screenshot_data[i] = {
+                "name": name,
+                "timestamp": timestamp.isoformat(),
+                "base64_data": data,
+                "path": path
+            }
+        
         # Convert result to dictionary
         result_dict = {
             "status": result.status.value,
             "message": result.message,
             "details": result.details or {"found": result.found},
             "evidence_dir": result.evidence_dir,
-            "screenshot_data": [
-                {
-                    "name": screenshot.name,
-                    "timestamp": screenshot.timestamp.isoformat(),
-                    "base64_data": screenshot.data,
-                    "path": screenshot.path
-                }
-                for screenshot in result.screenshots
-            ],
+            "screenshot_data": screenshot_data,
             "execution_time": result.execution_time
         }
         
@@ -15,22 +15,82 @@ This module:
 """
 
 import logging
+import re
 from typing import Dict, Any, Optional
 from datetime import datetime
 import asyncio
 
-from providers.mfn.validation import MFNValidation
+from providers.mfn.validation import (
+    MFNValidation, MFNSessionPool, BROWSER_PROBE_ERRORS,
+    HISTORY_TABLE_SELECTOR, HISTORY_ROW_SELECTOR
+)
 from provider_factory import AutomationError
 
 logger = logging.getLogger(__name__)
 
+_DIGITS_RE = re.compile(r'\d+')
+
+# Open the cancel form, fill the reason, confirm and read the reference in one
+# browser call. The stage is kept in sessionStorage so it can still be read if
+# the confirm click navigates away and the script's result is lost.
+# args: [reason, timeout_ms]
+SUBMIT_CANCELLATION_SCRIPT = """
+const [reason, timeoutMs] = arguments;
+const stageKey = 'mfn-cancel-stage';
+const waitFor = (selector) => new Promise((resolve) => {
+    const deadline = Date.now() + timeoutMs;
+    const poll = () => {
+        const el = document.querySelector(selector);
+        if (el || Date.now() > deadline) return resolve(el);
+        setTimeout(poll, 100);
+    };
+    poll();
+});
+return (async () => {
+    sessionStorage.removeItem(stageKey);
+    const button = document.querySelector(
+        'button#cancel-service, a#cancel-service, button.cancel-btn');
+    if (!button) return {clicked: false, confirmed: false, reference: null};
+    sessionStorage.setItem(stageKey, 'clicked');
+    button.click();
+    await waitFor('textarea#cancellation_reason, form.cancellation-form, .modal.cancellation');
+    const field = document.querySelector('textarea#cancellation_reason');
+    if (field) {
+        field.value = reason;
+        field.dispatchEvent(new Event('input', {bubbles: true}));
+    }
+    const confirm = document.querySelector('button#confirm-cancellation');
+    if (!confirm) return {clicked: true, confirmed: false, reference: null};
+    sessionStorage.setItem(stageKey, 'confirmed');
+    confirm.click();
+    const ref = await waitFor('#cancellation-reference, .cancellation-id');
+    return {clicked: true, confirmed: true, reference: ref ? ref.innerText : null};
+})();
+"""
+
 
 class MFNCancellation(MFNValidation):
     """MetroFiber service cancellation automation"""
     
+    # Candidate selectors, combined so each probe is a single browser query
+    CANCEL_BUTTON_SELECTOR = (
+        "button#cancel-service, a#cancel-service, button:has-text('Cancel Service'), "
+        "a:has-text('Cancel Service'), button.cancel-btn"
+    )
+    CANCEL_BUTTON_XPATH = "//button[contains(text(), 'Cancel')]"
+    CONFIRM_BUTTON_SELECTOR = (
+        "button#confirm-cancellation, button:has-text('Confirm'), "
+        "button:has-text('Submit'), button[type='submit']"
+    )
+    REFERENCE_SELECTOR = (
+        "#cancellation-reference, .cancellation-id, "
+        ":text-is('Reference:'), :text-is('Cancellation ID:')"
+    )
+    
     def __init__(self, browser_client):
         super().__init__(browser_client)
         self.cancellation_captured_id = None
+        self._submitted_reference: Optional[str] = None
     
     async def execute(self, job_id: int, parameters: Dict) -> Dict:
         """
@@ -56,13 +116,12 @@ class MFNCancellation(MFNValidation):
         if not circuit_number:
             raise AutomationError("circuit_number or order_id is required")
         
+        self._should_cleanup = True
         try:
-            # Create browser session
-            await self.create_session(job_id)
-            
-            # Login (inherited from validation)
-            logger.info(f"Job {job_id}: Logging into MFN portal")
-            await self._login()
+            # Check out a logged-in browser session (login inherited from validation)
+            logger.info(f"Job {job_id}: Acquiring logged-in MFN portal session")
+            if await MFNSessionPool.acquire(self, job_id):
+                logger.info(f"Job {job_id}: Reusing logged-in MFN portal session")
             
             # Search for service (inherited from validation)
             logger.info(f"Job {job_id}: Searching for circuit {circuit_number}")
@@ -72,7 +131,9 @@ class MFNCancellation(MFNValidation):
             
             if not service_found:
                 logger.info(f"Job {job_id}: Service not found, cannot cancel")
-                return self._build_not_found_result()
+                await self._flush_screenshots()
+                self._release_session()
+                return await self._build_not_found_result()
             
             # Open service details
             logger.info(f"Job {job_id}: Opening service details")
@@ -84,7 +145,9 @@ class MFNCancellation(MFNValidation):
             
             if already_cancelled:
                 logger.info(f"Job {job_id}: Service already has pending cancellation")
-                return self._build_already_cancelled_result()
+                await self._flush_screenshots()
+                self._release_session()
+                return await self._build_already_cancelled_result()
             
             # Execute cancellation
             logger.info(f"Job {job_id}: Executing cancellation")
@@ -95,7 +158,9 @@ class MFNCancellation(MFNValidation):
             await self._capture_cancellation_reference()
             
             # Build result
-            result = self._build_cancellation_success_result()
+            await self._flush_screenshots()
+            self._release_session()
+            result = await self._build_cancellation_success_result()
             
             logger.info(f"Job {job_id}: MFN cancellation completed successfully")
             return result
@@ -106,7 +171,9 @@ class MFNCancellation(MFNValidation):
             raise AutomationError(f"MFN cancellation failed: {str(e)}")
         
         finally:
-            await self.cleanup()
+            await self._flush_screenshots()
+            if self._should_cleanup:
+                await self.cleanup()
     
     async def _open_service_details(self, circuit_number: str):
         """Open service detail page"""
@@ -116,7 +183,7 @@ class MFNCancellation(MFNValidation):
                 self.session_id,
                 f"a[data-circuit='{circuit_number}']"
             )
-            await asyncio.sleep(2)
+            self._page_changed()
             
             # Wait for detail page
             await self.browser.wait_for_selector(
@@ -126,12 +193,7 @@ class MFNCancellation(MFNValidation):
             )
             
             # Take screenshot
-            screenshot = await self.take_screenshot("service_details_before_cancel")
-            self.screenshots.append({
-                "name": "service_details_before_cancel",
-                "data": screenshot,
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            await self._capture_screenshot("service_details_before_cancel")
             
         except Exception as e:
             raise AutomationError(f"Failed to open service details: {str(e)}")
@@ -139,27 +201,16 @@ class MFNCancellation(MFNValidation):
     async def _check_existing_cancellation(self) -> bool:
         """Check if service already has pending cancellation"""
         try:
-            # Look for cancellation indicator in the UI
-            cancellation_pending = await self.browser.is_visible(
+            # One query covers both the pending banner and the status field
+            elements = await self.browser.query_all(
                 self.session_id,
-                "text='Cancellation Pending'",
-                timeout=3
+                "#status, :text-is('Cancellation Pending')"
             )
             
-            if cancellation_pending:
-                return True
-            
-            # Check status field
-            try:
-                status_text = await self.browser.get_text(
-                    self.session_id,
-                    "#status",
-                    timeout=3
-                )
-                if "cancel" in status_text.lower() or "pending" in status_text.lower():
+            for element in elements:
+                text = element.get("text", "").lower()
+                if "cancel" in text or "pending" in text:
                     return True
-            except:
-                pass
             
             return False
             
@@ -170,32 +221,24 @@ class MFNCancellation(MFNValidation):
     async def _execute_cancellation(self, reason: str):
         """Execute the cancellation workflow"""
         try:
+            # Fast path: the whole submit in one browser call
+            stage = await self._submit_cancellation_fused(reason)
+            if stage == "confirmed":
+                self._page_changed()
+                await self._capture_screenshot("after_cancellation_submit")
+                return
+            
+            # Selector-by-selector fallback, resuming after any step the script completed
             # Look for cancellation button on detail page
             # The button is typically in the action bar at the top
-            cancellation_button_selectors = [
-                "button#cancel-service",
-                "a#cancel-service",
-                "button:has-text('Cancel Service')",
-                "a:has-text('Cancel Service')",
-                "button.cancel-btn",
-                "//button[contains(text(), 'Cancel')]"
-            ]
-            
-            button_clicked = False
-            for selector in cancellation_button_selectors:
-                try:
-                    button_visible = await self.browser.is_visible(
-                        self.session_id,
-                        selector,
-                        timeout=3
-                    )
-                    if button_visible:
-                        await self.browser.click(self.session_id, selector)
-                        button_clicked = True
-                        logger.info(f"Clicked cancellation button: {selector}")
-                        break
-                except:
-                    continue
+            button_clicked = stage == "clicked"
+            if not button_clicked:
+                selector = await self._click_first(
+                    [self.CANCEL_BUTTON_SELECTOR, self.CANCEL_BUTTON_XPATH]
+                )
+                if selector:
+                    button_clicked = True
+                    logger.info(f"Clicked cancellation button: {selector}")
             
             if not button_clicked:
                 # Try scrolling up to see the button
@@ -203,114 +246,127 @@ class MFNCancellation(MFNValidation):
                     self.session_id,
                     "window.scrollTo(0, 0)"
                 )
-                await asyncio.sleep(1)
                 
                 # Take screenshot to debug
-                screenshot = await self.take_screenshot("cancellation_button_not_found")
-                self.screenshots.append({
-                    "name": "cancellation_button_not_found",
-                    "data": screenshot,
-                    "timestamp": datetime.utcnow().isoformat()
-                })
+                self._record_screenshot("cancellation_button_not_found")
                 
                 raise AutomationError("Could not find cancellation button")
             
             # Wait for cancellation form/modal
-            await asyncio.sleep(2)
+            try:
+                await self.browser.wait_for_selector(
+                    self.session_id,
+                    "textarea#cancellation_reason, form.cancellation-form, .modal.cancellation",
+                    timeout=self.WAIT_TIMEOUT
+                )
+            except Exception as e:
+                logger.warning(f"Cancellation form did not appear: {str(e)}")
             
             # Take screenshot of cancellation form
-            screenshot = await self.take_screenshot("cancellation_form")
-            self.screenshots.append({
-                "name": "cancellation_form",
-                "data": screenshot,
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            await self._capture_screenshot("cancellation_form")
             
             # Fill cancellation reason if field exists
             try:
-                reason_field_visible = await self.browser.is_visible(
+                await self.browser.type_text(
                     self.session_id,
                     "textarea#cancellation_reason",
+                    reason,
                     timeout=3
                 )
-                if reason_field_visible:
-                    await self.browser.type_text(
-                        self.session_id,
-                        "textarea#cancellation_reason",
-                        reason
-                    )
-            except:
+            except BROWSER_PROBE_ERRORS:
                 logger.info("No cancellation reason field found, skipping")
             
             # Click confirm/submit button
-            confirm_selectors = [
-                "button#confirm-cancellation",
-                "button:has-text('Confirm')",
-                "button:has-text('Submit')",
-                "button[type='submit']"
-            ]
-            
             confirmed = False
-            for selector in confirm_selectors:
-                try:
-                    button_visible = await self.browser.is_visible(
-                        self.session_id,
-                        selector,
-                        timeout=3
-                    )
-                    if button_visible:
-                        await self.browser.click(self.session_id, selector)
-                        confirmed = True
-                        logger.info(f"Clicked confirm button: {selector}")
-                        break
-                except:
-                    continue
+            selector = await self._click_first([self.CONFIRM_BUTTON_SELECTOR])
+            if selector:
+                self._page_changed()
+                confirmed = True
+                logger.info(f"Clicked confirm button: {selector}")
             
             if not confirmed:
                 raise AutomationError("Could not find confirmation button")
             
             # Wait for submission to complete
-            await asyncio.sleep(3)
+            try:
+                await self.browser.wait_for_selector(
+                    self.session_id,
+                    "#cancellation-reference, .cancellation-id, .success",
+                    timeout=self.WAIT_TIMEOUT
+                )
+            except Exception as e:
+                logger.warning(f"No confirmation shown after submit: {str(e)}")
             
             # Take screenshot after submission
-            screenshot = await self.take_screenshot("after_cancellation_submit")
-            self.screenshots.append({
-                "name": "after_cancellation_submit",
-                "data": screenshot,
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            await self._capture_screenshot("after_cancellation_submit")
             
         except Exception as e:
             raise AutomationError(f"Failed to execute cancellation: {str(e)}")
     
+    async def _submit_cancellation_fused(self, reason: str) -> Optional[str]:
+        """
+        Run the cancel/confirm sequence in a single script
+        
+        Returns:
+            "confirmed" when submitted, "clicked" when the form was opened
+            but not confirmed, or None when nothing was clicked
+        """
+        try:
+            result = await self.browser.execute_script(
+                self.session_id,
+                SUBMIT_CANCELLATION_SCRIPT,
+                [reason, self.WAIT_TIMEOUT * 1000]
+            )
+        except BROWSER_PROBE_ERRORS as e:
+            # The confirm click may have navigated away mid-script; ask the new page
+            logger.info(f"Fused cancellation submit interrupted: {str(e)}")
+            try:
+                return await self.browser.execute_script(
+                    self.session_id,
+                    "return sessionStorage.getItem('mfn-cancel-stage')"
+                )
+            except BROWSER_PROBE_ERRORS:
+                return None
+        
+        if not isinstance(result, dict) or not result.get("clicked"):
+            return None
+        if not result.get("confirmed"):
+            logger.info("Fused cancellation submit found no confirm button, falling back")
+            return "clicked"
+        
+        self._submitted_reference = result.get("reference")
+        logger.info("Cancellation submitted via fused script")
+        return "confirmed"
+    
+    async def _click_first(self, selectors, timeout: int = 3) -> Optional[str]:
+        """Click the first selector that becomes actionable; returns it, or None"""
+        for selector in selectors:
+            try:
+                await self.browser.click(self.session_id, selector, timeout=timeout)
+                return selector
+            except BROWSER_PROBE_ERRORS:
+                continue
+        return None
+    
     async def _capture_cancellation_reference(self):
         """Capture cancellation reference ID from confirmation"""
         try:
             # Look for success message with reference ID
-            reference_selectors = [
-                "#cancellation-reference",
-                ".cancellation-id",
-                "text='Reference:'",
-                "text='Cancellation ID:'"
-            ]
-            
-            for selector in reference_selectors:
-                try:
-                    ref_text = await self.browser.get_text(
-                        self.session_id,
-                        selector,
-                        timeout=3
-                    )
-                    if ref_text:
-                        # Extract ID from text (might be "Reference: 12345" or similar)
-                        import re
-                        match = re.search(r'\d+', ref_text)
-                        if match:
-                            self.cancellation_captured_id = match.group(0)
-                            logger.info(f"Captured cancellation ID: {self.cancellation_captured_id}")
-                            return
-                except:
-                    continue
+            try:
+                ref_text = self._submitted_reference or await self.browser.get_text(
+                    self.session_id,
+                    self.REFERENCE_SELECTOR,
+                    timeout=3
+                )
+                if ref_text:
+                    # Extract ID from text (might be "Reference: 12345" or similar)
+                    match = _DIGITS_RE.search(ref_text)
+                    if match:
+                        self.cancellation_captured_id = match.group(0)
+                        logger.info(f"Captured cancellation ID: {self.cancellation_captured_id}")
+                        return
+            except BROWSER_PROBE_ERRORS:
+                pass
             
             # If no reference found, try to get it from history
             logger.info("No reference ID in confirmation, checking history")
@@ -324,48 +380,47 @@ class MFNCancellation(MFNValidation):
         """Check history for the newly created cancellation record"""
         try:
             # Navigate back to service details if needed
-            current_url = await self.browser.get_current_url(self.session_id)
+            current_url = self._last_url or await self.browser.get_current_url(self.session_id)
+            self._last_url = current_url
             if "customerDetail" not in current_url:
                 # Need to return to main and search again
                 logger.info("Returning to main to check history")
-                await self.browser.navigate(
-                    self.session_id,
-                    f"{self.PORTAL_URL}main.php"
-                )
+                await self._navigate(f"{self.PORTAL_URL}main.php")
             
             # Click history button
             await self.browser.click(self.session_id, "button#history")
-            await asyncio.sleep(2)
-            
-            # Look for most recent cancellation record
-            history_rows = await self.browser.query_all(
+            self._page_changed()
+            await self.browser.wait_for_selector(
                 self.session_id,
-                "table#history-table tbody tr"
+                HISTORY_TABLE_SELECTOR,
+                timeout=self.WAIT_TIMEOUT
             )
             
-            # Check first row (most recent)
-            if history_rows:
-                first_row_text = history_rows[0].get("text", "").lower()
-                if "cancellation" in first_row_text and "captured" in first_row_text:
-                    # Try to extract ID
-                    import re
-                    match = re.search(r'\d+', first_row_text)
-                    if match:
-                        self.cancellation_captured_id = match.group(0)
-                        logger.info(f"Found cancellation ID in history: {self.cancellation_captured_id}")
+            # Only the first row (most recent) matters, so read just that row
+            try:
+                first_row_text = await self.browser.get_text(
+                    self.session_id,
+                    f"{HISTORY_ROW_SELECTOR}:first-child",
+                    timeout=3
+                )
+            except BROWSER_PROBE_ERRORS:
+                first_row_text = ""
+            
+            first_row_text = first_row_text.lower()
+            if "cancellation" in first_row_text and "captured" in first_row_text:
+                # Try to extract ID
+                match = _DIGITS_RE.search(first_row_text)
+                if match:
+                    self.cancellation_captured_id = match.group(0)
+                    logger.info(f"Found cancellation ID in history: {self.cancellation_captured_id}")
             
             # Take screenshot
-            screenshot = await self.take_screenshot("history_after_cancellation")
-            self.screenshots.append({
-                "name": "history_after_cancellation",
-                "data": screenshot,
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            self._record_screenshot("history_after_cancellation")
             
         except Exception as e:
             logger.warning(f"Failed to check history: {str(e)}")
     
-    def _build_cancellation_success_result(self) -> Dict:
+    async def _build_cancellation_success_result(self) -> Dict:
         """Build successful cancellation result"""
         return {
             "status": "success",
@@ -375,11 +430,11 @@ class MFNCancellation(MFNValidation):
             "cancellation_captured_id": self.cancellation_captured_id,
             "pending_cease_order": True,
             "evidence": {
-                "screenshots": self.screenshots
+                "screenshots": await self._evidence_screenshots()
             }
         }
     
-    def _build_already_cancelled_result(self) -> Dict:
+    async def _build_already_cancelled_result(self) -> Dict:
         """Build result when service is already cancelled"""
         return {
             "status": "success",
@@ -389,11 +444,11 @@ class MFNCancellation(MFNValidation):
             "already_cancelled": True,
             "pending_cease_order": True,
             "evidence": {
-                "screenshots": self.screenshots
+                "screenshots": await self._evidence_screenshots()
             }
         }
     
-    def _build_not_found_result(self) -> Dict:
+    async def _build_not_found_result(self) -> Dict:
         """Build not found result"""
         return {
             "status": "error",
@@ -401,6 +456,6 @@ class MFNCancellation(MFNValidation):
             "found": False,
             "cancellation_submitted": False,
             "evidence": {
-                "screenshots": self.screenshots
+                "screenshots": await self._evidence_screenshots()
             }
         }
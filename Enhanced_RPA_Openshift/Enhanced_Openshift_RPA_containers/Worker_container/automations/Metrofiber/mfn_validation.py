@@ -13,17 +13,184 @@ This module:
 - Returns standardized results
 """
 
+import base64
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
+from pathlib import Path
 import asyncio
 import os
+import time
 
+from browser_client import (
+    BrowserServiceError, SCREENSHOT_TYPE, SCREENSHOT_QUALITY, SCREENSHOT_EXTENSION
+)
 from provider_factory import BaseAutomation, AutomationError
 from config import Config
 
+try:
+    import valkey.asyncio as valkey_asyncio
+except ImportError:  # Cookie resume is optional
+    valkey_asyncio = None
+
 logger = logging.getLogger(__name__)
 
+# Failures from a single browser probe (missing element, timeout) that callers skip past
+BROWSER_PROBE_ERRORS = (BrowserServiceError, asyncio.TimeoutError)
+
+# Whether results carry base64 image data or only the evidence file paths
+INLINE_EVIDENCE = os.getenv("MFN_INLINE_EVIDENCE", "true").lower() == "true"
+
+# Shared store for portal cookies so a restarted worker can skip the login
+COOKIE_TTL = int(os.getenv("MFN_COOKIE_TTL", "1800"))
+_cookie_store = None
+
+
+def _get_cookie_store():
+    """Valkey client for saved cookies, or None when not configured"""
+    global _cookie_store
+    if _cookie_store is None and valkey_asyncio is not None and os.getenv("VALKEY_HOST"):
+        _cookie_store = valkey_asyncio.Valkey(
+            host=os.getenv("VALKEY_HOST"),
+            port=int(os.getenv("VALKEY_PORT", "6379")),
+            password=os.getenv("VALKEY_PASSWORD"),
+            db=int(os.getenv("VALKEY_DB", "0")),
+            socket_timeout=int(os.getenv("VALKEY_SOCKET_TIMEOUT", "5"))
+        )
+    return _cookie_store
+
+# Service detail page fields: (field name, selector)
+DETAIL_FIELDS = (
+    ("customer_name", "#customer"),
+    ("customer_id", "#customer_id_number"),
+    ("email", "#mail"),
+    ("mobile", "#mobile_number"),
+    ("address", "#ad1"),
+    ("fsan", "#fsan"),
+    ("activation_date", "#activation"),
+    ("package", "#package_upgrade_mrc"),
+    ("status", "#systemDate"),
+    ("circuit_number", "#id"),
+)
+
+HISTORY_TABLE_SELECTOR = "table#history-table"
+HISTORY_ROW_SELECTOR = "table#history-table tbody tr"
+
+# Scan the history rows in the page and return only the verdict
+# args: [row_selector] -> {found, captured, total}
+HISTORY_SCAN_SCRIPT = """
+const [rowSelector] = arguments;
+const rows = document.querySelectorAll(rowSelector);
+let found = false, captured = false;
+for (const row of rows) {
+    const text = row.innerText;
+    if (/cancel/i.test(text)) {
+        found = true;
+        if (/captured/i.test(text)) {
+            captured = true;
+            break;
+        }
+    }
+}
+return {found, captured, total: rows.length};
+"""
+
+# Read the text of several fields in one browser call
+# args: [[[field_name, selector], ...]] -> {field_name: trimmed text, null if missing}
+READ_FIELDS_SCRIPT = """
+const [fields] = arguments;
+return Object.fromEntries(fields.map(([name, selector]) => {
+    const el = document.querySelector(selector);
+    return [name, el ? el.textContent.trim() : null];
+}));
+"""
+
+
+class MFNSessionPool:
+    """
+    Logged-in MFN portal sessions shared between jobs in this worker
+    
+    Sessions are keyed by (portal, email). A session is health-checked when
+    it is checked out and evicted if it has expired or been logged out.
+    """
+    
+    TTL = int(os.getenv("MFN_SESSION_TTL", "600"))
+    MAX_IDLE = int(os.getenv("MFN_SESSION_POOL_SIZE", "4"))
+    
+    # (portal, email) -> queue of (session_id, login time)
+    _idle: Dict[Tuple[str, str], asyncio.Queue] = {}
+    
+    @classmethod
+    def _queue(cls, automation: "MFNValidation") -> asyncio.Queue:
+        key = (automation.PORTAL_URL, automation.EMAIL)
+        if key not in cls._idle:
+            cls._idle[key] = asyncio.Queue(maxsize=cls.MAX_IDLE)
+        return cls._idle[key]
+    
+    @classmethod
+    async def acquire(cls, automation: "MFNValidation", job_id: int) -> bool:
+        """
+        Give the automation a logged-in session
+        
+        Returns:
+            True if a pooled session was reused, False if a new one logged in
+        """
+        queue = cls._queue(automation)
+        while not queue.empty():
+            session_id, logged_in_at = queue.get_nowait()
+            automation.session_id = session_id
+            if time.monotonic() - logged_in_at < cls.TTL and await automation._session_alive():
+                automation._logged_in_at = logged_in_at
+                return True
+            # Expired or logged out - evict
+            await automation.cleanup()
+        
+        await automation.create_session(job_id)
+        if await automation._try_resume():
+            logger.info(f"Job {job_id}: Resumed MFN portal login from saved cookies")
+        else:
+            await automation._login()
+            await automation._save_cookies()
+        automation._logged_in_at = time.monotonic()
+        return False
+    
+    @classmethod
+    def release(cls, automation: "MFNValidation") -> bool:
+        """
+        Return the automation's session to the pool
+        
+        Returns:
+            True if pooled, False if the pool is full and the session is left attached
+        """
+        if not automation.session_id or automation._logged_in_at is None:
+            return False
+        try:
+            cls._queue(automation).put_nowait((automation.session_id, automation._logged_in_at))
+        except asyncio.QueueFull:
+            return False
+        # Detach so cleanup() leaves the pooled session open
+        automation.session_id = None
+        return True
+    
+    @classmethod
+    async def close_all(cls, browser_client) -> int:
+        """
+        Close every idle pooled session (worker shutdown)
+        
+        Returns:
+            Number of sessions closed
+        """
+        closed = 0
+        for queue in cls._idle.values():
+            while not queue.empty():
+                session_id, _ = queue.get_nowait()
+                await browser_client.close_session(session_id)
+                closed += 1
+        cls._idle.clear()
+        return closed
+
 
 class MFNValidation(BaseAutomation):
     """MetroFiber service validation automation"""
@@ -37,11 +204,19 @@ class MFNValidation(BaseAutomation):
     WAIT_TIMEOUT = 15
     NAVIGATION_TIMEOUT = 30
     
+    # Fallback search tabs a job may have open at once
+    SEARCH_TABS = int(os.getenv("MFN_SEARCH_TABS", "3"))
+    
     def __init__(self, browser_client):
         super().__init__(browser_client)
         self.job_id = None
         self.screenshots = []
         self.service_location = None
+        self._last_url: Optional[str] = None
+        self._logged_in_at: Optional[float] = None
+        self._pending_shots: List[asyncio.Task] = []
+        self._should_cleanup = True
+        self._search_tabs = asyncio.Semaphore(self.SEARCH_TABS)
         
         if not all([self.PORTAL_URL, self.EMAIL, self.PASSWORD]):
             raise ValueError("Missing MFN portal configuration")
@@ -68,13 +243,12 @@ class MFNValidation(BaseAutomation):
         if not circuit_number:
             raise AutomationError("circuit_number or order_id is required")
         
+        self._should_cleanup = True
         try:
-            # Create browser session
-            await self.create_session(job_id)
-            
-            # Execute validation workflow
-            logger.info(f"Job {job_id}: Logging into MFN portal")
-            await self._login()
+            # Check out a logged-in browser session
+            logger.info(f"Job {job_id}: Acquiring logged-in MFN portal session")
+            if await MFNSessionPool.acquire(self, job_id):
+                logger.info(f"Job {job_id}: Reusing logged-in MFN portal session")
             
             logger.info(f"Job {job_id}: Searching for circuit {circuit_number}")
             service_found = await self._search_service(
@@ -83,7 +257,9 @@ class MFNValidation(BaseAutomation):
             
             if not service_found:
                 logger.info(f"Job {job_id}: Service not found")
-                return self._build_not_found_result()
+                await self._flush_screenshots()
+                self._release_session()
+                return await self._build_not_found_result()
             
             logger.info(f"Job {job_id}: Extracting service details")
             service_data = await self._extract_service_details(circuit_number)
@@ -92,7 +268,9 @@ class MFNValidation(BaseAutomation):
             history_data = await self._check_service_history()
             
             # Build result
-            result = self._build_success_result(service_data, history_data)
+            await self._flush_screenshots()
+            self._release_session()
+            result = await self._build_success_result(service_data, history_data)
             
             logger.info(f"Job {job_id}: MFN validation completed successfully")
             return result
@@ -103,17 +281,44 @@ class MFNValidation(BaseAutomation):
             raise AutomationError(f"MFN validation failed: {str(e)}")
         
         finally:
-            await self.cleanup()
+            await self._flush_screenshots()
+            if self._should_cleanup:
+                await self.cleanup()
+    
+    @classmethod
+    async def execute_batch(cls, browser_client, jobs: List[Tuple[int, Dict]],
+                            concurrency: int = 10) -> List[Any]:
+        """
+        Execute several jobs concurrently, each with its own automation instance
+        
+        Args:
+            browser_client: Browser service client shared by all jobs
+            jobs: (job_id, parameters) pairs
+            concurrency: Maximum jobs in flight at once
+            
+        Returns:
+            One entry per job, in order: its result dict, or the exception it raised
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(job_id: int, parameters: Dict) -> Dict:
+            async with semaphore:
+                return await cls(browser_client).execute(job_id, parameters)
+        
+        return await asyncio.gather(
+            *(run(job_id, parameters) for job_id, parameters in jobs),
+            return_exceptions=True
+        )
+    
+    def _release_session(self):
+        """Hand a healthy session back to the pool; only tear it down if the pool is full"""
+        self._should_cleanup = not MFNSessionPool.release(self)
     
     async def _login(self):
         """Login to MFN portal"""
         try:
             # Navigate to portal
-            await self.browser.navigate(
-                self.session_id,
-                self.PORTAL_URL,
-                wait_until="networkidle"
-            )
+            await self._navigate(self.PORTAL_URL)
             
             # Wait for login form
             await self.browser.wait_for_selector(
@@ -137,13 +342,16 @@ class MFNValidation(BaseAutomation):
             
             # Submit form
             await self.browser.click(self.session_id, "button[type='submit']")
+            self._page_changed()
             
             # Wait for navigation to main page
-            await asyncio.sleep(2)
-            
-            # Verify login success
-            current_url = await self.browser.get_current_url(self.session_id)
-            if "main.php" not in current_url.lower():
+            try:
+                await self.browser.wait_for_url(
+                    self.session_id,
+                    "**/main.php*",
+                    timeout=self.NAVIGATION_TIMEOUT
+                )
+            except BROWSER_PROBE_ERRORS:
                 screenshot = await self.take_screenshot("login_failed")
                 raise AutomationError("Login failed - did not reach main page")
             
@@ -152,76 +360,118 @@ class MFNValidation(BaseAutomation):
         except Exception as e:
             raise AutomationError(f"Login failed: {str(e)}")
     
+    def _cookie_key(self) -> str:
+        credentials = f"{self.PORTAL_URL}|{self.EMAIL}".encode()
+        return f"mfn:cookies:{hashlib.sha256(credentials).hexdigest()}"
+    
+    async def _try_resume(self) -> bool:
+        """Load saved portal cookies into the session; True if they are still logged in"""
+        store = _get_cookie_store()
+        if store is None:
+            return False
+        try:
+            saved = await store.get(self._cookie_key())
+            if not saved:
+                return False
+            await self.browser.set_cookies(self.session_id, json.loads(saved))
+        except Exception as e:
+            logger.info(f"Could not restore saved MFN cookies: {str(e)}")
+            return False
+        return await self._on_main_page()
+    
+    async def _save_cookies(self):
+        """Save the logged-in portal cookies for other workers and restarts"""
+        store = _get_cookie_store()
+        if store is None:
+            return
+        try:
+            cookies = await self.browser.get_cookies(self.session_id)
+            await store.set(self._cookie_key(), json.dumps(cookies), ex=COOKIE_TTL)
+        except Exception as e:
+            logger.warning(f"Could not save MFN cookies: {str(e)}")
+    
+    async def _session_alive(self) -> bool:
+        """
+        Cheap check of a pooled session without navigating it
+        
+        The session must still be open on the portal and not showing the
+        login form. Server-side expiry is bounded by the pool TTL.
+        """
+        try:
+            current_url = await self.browser.get_current_url(self.session_id)
+        except Exception as e:
+            logger.info(f"Pooled MFN session is no longer usable: {str(e)}")
+            return False
+        if not current_url.startswith(self.PORTAL_URL):
+            return False
+        return not await self.browser.is_visible(self.session_id, "input[name='password']", timeout=1)
+    
+    async def _on_main_page(self) -> bool:
+        """Check that the session is still logged in by loading main.php"""
+        try:
+            await self._navigate(f"{self.PORTAL_URL}main.php")
+            current_url = await self.browser.get_current_url(self.session_id)
+            return "main.php" in current_url.lower()
+        except Exception as e:
+            logger.info(f"Pooled MFN session is no longer usable: {str(e)}")
+            return False
+    
+    async def _navigate(self, url: str, wait_until: str = "networkidle"):
+        """Navigate and remember the URL so route checks can skip a round-trip"""
+        await self.browser.navigate(self.session_id, url, wait_until=wait_until)
+        self._page_changed(url)
+    
+    def _page_changed(self, url: Optional[str] = None):
+        """Record that the main page navigated, forgetting the old URL"""
+        self._last_url = url
+    
     async def _search_service(self, circuit_number: str, customer_name: str = "", 
                              customer_id: str = "", fsan: str = "") -> bool:
         """
         Search for service in MFN portal
         
+        The circuit search runs on the main page. Only if it misses do the
+        customer name and FSAN fallbacks start, concurrently in extra tabs.
+        They are resolved in priority order and the winning tab becomes the
+        session's main page, so the detail steps continue on its results.
+        
         Returns:
             True if service found, False otherwise
         """
-        try:
-            # Navigate to search page
-            search_url = f"{self.PORTAL_URL}customerSearch.php"
-            await self.browser.navigate(self.session_id, search_url, wait_until="networkidle")
-            
-            # Wait for search form
-            await self.browser.wait_for_selector(
-                self.session_id,
-                "input[name='circuit_number']",
-                timeout=self.WAIT_TIMEOUT
+        search_url = f"{self.PORTAL_URL}customerSearch.php"
+        searches = [
+            (field, value, location)
+            for field, value, location in (
+                ("circuit_number", circuit_number, "circuit_search"),
+                ("customer_name", customer_name, "customer_search"),
+                ("fsan", fsan, "fsan_search"),
             )
-            
-            # Try circuit number search first
-            if circuit_number:
-                logger.info(f"Job {self.job_id}: Searching by circuit number: {circuit_number}")
-                await self.browser.type_text(
-                    self.session_id,
-                    "input[name='circuit_number']",
-                    circuit_number
-                )
-                
-                await self.browser.click(self.session_id, "button[name='search']")
-                await asyncio.sleep(2)
-                
-                # Check if service found
-                service_found = await self._check_search_results()
-                if service_found:
-                    self.service_location = "circuit_search"
-                    return True
-            
-            # Try customer name search
-            if customer_name:
-                logger.info(f"Job {self.job_id}: Searching by customer name: {customer_name}")
-                await self.browser.navigate(self.session_id, search_url)
-                await self.browser.type_text(
-                    self.session_id,
-                    "input[name='customer_name']",
-                    customer_name
-                )
-                await self.browser.click(self.session_id, "button[name='search']")
-                await asyncio.sleep(2)
-                
-                service_found = await self._check_search_results()
-                if service_found:
-                    self.service_location = "customer_search"
-                    return True
-            
-            # Try FSAN search
-            if fsan:
-                logger.info(f"Job {self.job_id}: Searching by FSAN: {fsan}")
-                await self.browser.navigate(self.session_id, search_url)
-                await self.browser.type_text(
-                    self.session_id,
-                    "input[name='fsan']",
-                    fsan
-                )
-                await self.browser.click(self.session_id, "button[name='search']")
-                await asyncio.sleep(2)
-                
-                service_found = await self._check_search_results()
-                if service_found:
-                    self.service_location = "fsan_search"
+            if value
+        ]
+        if not searches:
+            return False
+        
+        primary, fallbacks = searches[0], searches[1:]
+        try:
+            if await self._run_search(self.session_id, search_url, primary[0], primary[1]):
+                self.service_location = primary[2]
+                return True
+        except Exception as e:
+            raise AutomationError(f"Search failed: {str(e)}")
+        
+        fallback_tasks = [
+            asyncio.create_task(self._search_in_tab(search_url, field, value))
+            for field, value, _ in fallbacks
+        ]
+        winner = None
+        try:
+            for task, (_, _, location) in zip(fallback_tasks, fallbacks):
+                page_id = await task
+                if page_id:
+                    winner = page_id
+                    await self.browser.promote_page(page_id)
+                    self._page_changed()
+                    self.service_location = location
                     return True
             
             logger.info(f"Job {self.job_id}: Service not found in any search")
@@ -229,31 +479,79 @@ class MFNValidation(BaseAutomation):
             
         except Exception as e:
             raise AutomationError(f"Search failed: {str(e)}")
+        
+        finally:
+            for task in fallback_tasks:
+                task.cancel()
+            results = await asyncio.gather(*fallback_tasks, return_exceptions=True)
+            # Lower-priority tabs that also matched are left open by _search_in_tab
+            for page_id in results:
+                if isinstance(page_id, str) and page_id != winner:
+                    await self.browser.close_page(page_id)
     
-    async def _check_search_results(self) -> bool:
-        """Check if search returned results"""
+    async def _run_search(self, page_id: str, search_url: str, field: str, value: str) -> bool:
+        """Run one search on the given page or tab; True if results were returned"""
+        logger.info(f"Job {self.job_id}: Searching by {field.replace('_', ' ')}: {value}")
+        await self.browser.navigate(page_id, search_url, wait_until="networkidle")
+        
+        # Wait for search form
+        await self.browser.wait_for_selector(
+            page_id,
+            f"input[name='{field}']",
+            timeout=self.WAIT_TIMEOUT
+        )
+        await self.browser.type_text(page_id, f"input[name='{field}']", value)
+        await self.browser.click(page_id, "button[name='search']")
+        if page_id == self.session_id:
+            self._page_changed()
+        
+        # Let the search request settle, then confirm which outcome rendered
         try:
-            # Check for "no results" message
-            no_results_visible = await self.browser.is_visible(
-                self.session_id,
-                "text='No results found'",
-                timeout=3
+            await self.browser.wait_for_load_state(
+                page_id,
+                "networkidle",
+                timeout=self.NAVIGATION_TIMEOUT
             )
-            
-            if no_results_visible:
-                return False
-            
-            # Check for results table
-            results_table_visible = await self.browser.is_visible(
-                self.session_id,
-                "table.results",
-                timeout=3
+        except BROWSER_PROBE_ERRORS:
+            logger.warning(f"Job {self.job_id}: Search page did not settle")
+        return await self._check_search_results(page_id)
+    
+    async def _search_in_tab(self, search_url: str, field: str, value: str) -> Optional[str]:
+        """
+        Run a fallback search in its own tab of the logged-in session
+        
+        Returns:
+            The tab's page_id if the search matched (left open), else None
+        """
+        async with self._search_tabs:
+            page_id = await self.browser.new_page(self.session_id)
+            found = False
+            try:
+                found = await self._run_search(page_id, search_url, field, value)
+                return page_id if found else None
+            except Exception as e:
+                logger.warning(f"Job {self.job_id}: Search by {field} failed: {str(e)}")
+                return None
+            finally:
+                if not found:
+                    # Shielded so a cancelled search still closes its tab
+                    await asyncio.shield(self.browser.close_page(page_id))
+    
+    async def _check_search_results(self, page_id: Optional[str] = None) -> bool:
+        """Wait for the search outcome; True if the results table appears first"""
+        try:
+            outcome = await self.browser.wait_any(
+                page_id or self.session_id,
+                ["table.results", "text='No results found'"],
+                timeout=self.WAIT_TIMEOUT
             )
-            
-            return results_table_visible
-            
-        except:
+        except BROWSER_PROBE_ERRORS as e:
+            logger.warning(f"Job {self.job_id}: Search results did not appear: {str(e)}")
             return False
+        
+        if outcome < 0:
+            logger.warning(f"Job {self.job_id}: Search results did not appear")
+        return outcome == 0
     
     async def _extract_service_details(self, circuit_number: str) -> Dict[str, Any]:
         """Extract service details from detail page"""
@@ -263,7 +561,7 @@ class MFNValidation(BaseAutomation):
                 self.session_id,
                 f"a[data-circuit='{circuit_number}']"
             )
-            await asyncio.sleep(2)
+            self._page_changed()
             
             # Wait for detail page
             await self.browser.wait_for_selector(
@@ -275,39 +573,23 @@ class MFNValidation(BaseAutomation):
             # Extract fields
             details = {}
             
-            # List of fields to extract
-            fields = {
-                "customer_name": "#customer",
-                "customer_id": "#customer_id_number",
-                "email": "#mail",
-                "mobile": "#mobile_number",
-                "address": "#ad1",
-                "fsan": "#fsan",
-                "activation_date": "#activation",
-                "package": "#package_upgrade_mrc",
-                "status": "#systemDate",
-                "circuit_number": "#id"
-            }
-            
-            for field_name, selector in fields.items():
-                try:
-                    value = await self.browser.get_text(
-                        self.session_id,
-                        selector,
-                        timeout=5
-                    )
-                    details[field_name] = value.strip()
-                except:
+            values = await self.browser.execute_script(
+                self.session_id,
+                READ_FIELDS_SCRIPT,
+                [DETAIL_FIELDS]
+            ) or {}
+            
+            for field_name, selector in DETAIL_FIELDS:
+                value = values.get(field_name)
+                if value is None:
+                    # Element not on the page - an empty field is not a failure
                     details[field_name] = ""
                     logger.warning(f"Could not extract field: {field_name}")
+                else:
+                    details[field_name] = value
             
             # Take screenshot of details
-            screenshot = await self.take_screenshot("service_details")
-            self.screenshots.append({
-                "name": "service_details",
-                "data": screenshot,
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            await self._capture_screenshot("service_details")
             
             return details
             
@@ -319,45 +601,29 @@ class MFNValidation(BaseAutomation):
         try:
             # Click history button
             await self.browser.click(self.session_id, "button#history")
-            await asyncio.sleep(2)
+            self._page_changed()
             
             # Wait for history table
             await self.browser.wait_for_selector(
                 self.session_id,
-                "table#history-table",
+                HISTORY_TABLE_SELECTOR,
                 timeout=self.WAIT_TIMEOUT
             )
             
-            # Extract history records
-            history_rows = await self.browser.query_all(
+            # Check the rows for a cancellation without shipping them back
+            scan = await self.browser.execute_script(
                 self.session_id,
-                "table#history-table tbody tr"
-            )
-            
-            cancellation_found = False
-            cancellation_captured = False
-            
-            for row in history_rows:
-                # Check if row contains cancellation
-                row_text = row.get("text", "").lower()
-                if "cancellation" in row_text or "cancel" in row_text:
-                    cancellation_found = True
-                    if "captured" in row_text:
-                        cancellation_captured = True
-                        break
+                HISTORY_SCAN_SCRIPT,
+                [HISTORY_ROW_SELECTOR]
+            ) or {}
             
             # Take screenshot
-            screenshot = await self.take_screenshot("service_history")
-            self.screenshots.append({
-                "name": "service_history",
-                "data": screenshot,
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            self._record_screenshot("service_history")
             
             return {
-                "cancellation_found": cancellation_found,
-                "cancellation_captured": cancellation_captured,
-                "total_records": len(history_rows)
+                "cancellation_found": bool(scan.get("found")),
+                "cancellation_captured": bool(scan.get("captured")),
+                "total_records": scan.get("total", 0)
             }
             
         except Exception as e:
@@ -368,7 +634,91 @@ class MFNValidation(BaseAutomation):
                 "total_records": 0
             }
     
-    def _build_success_result(self, service_data: Dict, history_data: Dict) -> Dict:
+    def _record_screenshot(self, name: str) -> asyncio.Task:
+        """
+        Start an evidence screenshot in the background, keeping its place in the list
+        
+        Only use this when nothing changes the page before the job returns;
+        otherwise use _capture_screenshot so the shot shows the named state.
+        """
+        record = {
+            "name": name,
+            "path": None,
+            "timestamp_ns": time.time_ns()
+        }
+        self.screenshots.append(record)
+        task = asyncio.create_task(self._snap(record))
+        self._pending_shots.append(task)
+        return task
+    
+    async def _capture_screenshot(self, name: str):
+        """Take an evidence screenshot and wait for it before the page is changed"""
+        # A failed shot is logged and dropped by _flush_screenshots, not raised here
+        await asyncio.wait([self._record_screenshot(name)])
+    
+    async def _snap(self, record: Dict[str, Any]):
+        """Capture a screenshot and write it to the job's evidence directory"""
+        if not self.session_id:
+            raise AutomationError("No active session for screenshot")
+        # screenshot_raw decodes off the event loop
+        data = await self.browser.screenshot_raw(
+            self.session_id,
+            full_page=False,
+            image_type=SCREENSHOT_TYPE,
+            quality=SCREENSHOT_QUALITY
+        )
+        path = Path(Config.get_job_screenshot_dir(self.job_id)) / (
+            f"{record['name']}_{record['timestamp_ns']}.{SCREENSHOT_EXTENSION}"
+        )
+        await asyncio.to_thread(self._write_evidence, path, data)
+        record["path"] = str(path)
+    
+    @staticmethod
+    def _write_evidence(path: Path, data: bytes):
+        """Write screenshot bytes to disk, creating the evidence directory if needed"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    
+    async def _flush_screenshots(self):
+        """Wait for background screenshots and drop any that failed"""
+        if not self._pending_shots:
+            return
+        results = await asyncio.gather(*self._pending_shots, return_exceptions=True)
+        self._pending_shots = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning(f"Screenshot failed: {str(result)}")
+        self.screenshots = [shot for shot in self.screenshots if shot.get("path")]
+    
+    @staticmethod
+    def _read_evidence(path: str) -> str:
+        """Read a screenshot back from disk as base64"""
+        return base64.b64encode(Path(path).read_bytes()).decode("ascii")
+    
+    async def _inline_evidence(self, entry: Dict[str, Any]):
+        """Attach a screenshot's image data, reading and encoding it off the event loop"""
+        try:
+            entry["data"] = await asyncio.to_thread(self._read_evidence, entry["path"])
+        except OSError as e:
+            logger.warning(f"Could not read screenshot {entry['path']}: {str(e)}")
+    
+    async def _evidence_screenshots(self) -> list:
+        """Evidence screenshots for the result, reading image data back from disk if inlined"""
+        evidence = [
+            {
+                "name": shot["name"],
+                "path": shot["path"],
+                "timestamp": datetime.fromtimestamp(
+                    shot["timestamp_ns"] / 1e9, timezone.utc
+                ).isoformat()
+            }
+            for shot in self.screenshots
+        ]
+        if INLINE_EVIDENCE:
+            await asyncio.gather(*[self._inline_evidence(entry) for entry in evidence])
+        return evidence
+    
+    async def _build_success_result(self, service_data: Dict, history_data: Dict) -> Dict:
         """Build successful validation result"""
         return {
             "status": "success",
@@ -380,11 +730,11 @@ class MFNValidation(BaseAutomation):
             "history": history_data,
             "pending_cease_order": history_data.get("cancellation_captured", False),
             "evidence": {
-                "screenshots": self.screenshots
+                "screenshots": await self._evidence_screenshots()
             }
         }
     
-    def _build_not_found_result(self) -> Dict:
+    async def _build_not_found_result(self) -> Dict:
         """Build not found result"""
         return {
             "status": "success",
@@ -393,6 +743,6 @@ class MFNValidation(BaseAutomation):
             "is_active": False,
             "service_location": None,
             "evidence": {
-                "screenshots": self.screenshots
+                "screenshots": await self._evidence_screenshots()
             }
         }
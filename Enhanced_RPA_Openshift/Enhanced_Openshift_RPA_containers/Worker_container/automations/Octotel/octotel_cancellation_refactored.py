@@ -7,11 +7,13 @@ Follows validation execution pattern at the end.
 
 import os
 import time
+import asyncio
 import logging
 import traceback
 import json
 import base64
 import re
+from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -22,6 +24,16 @@ from pydantic import BaseModel, Field
 from config import Config
 from browser_client import BrowserServiceClient, BrowserServiceError
 
+try:
+    import pyotp
+except ImportError:  # Only needed when the orchestrator does not supply a code
+    pyotp = None
+
+try:
+    from providers.octotel.validation import execute as validation_execute
+except ImportError:  # Follow-up validation is skipped without it
+    validation_execute = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +42,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Release reference formats, in order of preference
+_RELEASE_REF_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (r'(CR[\-_]?\d{6,})', r'(CHG[\-_]?\d{6,})', r'([A-Z]{2,3}\d{6,})')
+]
+
+_SUCCESS_RE = re.compile(r'request submitted|cancellation submitted|successfully submitted', re.IGNORECASE)
+
+# Page-side conditions polled instead of fixed sleeps
+SUBMIT_SETTLED_CONDITION = (
+    "/request submitted|cancellation submitted|successfully submitted|CR[-_]?\\d{6,}|CHG[-_]?\\d{6,}/i"
+    ".test(document.body.innerText)"
+)
+
+# Sets type to cancellation, waits for the reason dropdown to enable, then sets the reason
+FORM_DEFAULTS_SCRIPT = """
+const fire = (el) => el.dispatchEvent(new Event('change', {bubbles: true}));
+const typeSelect = document.querySelector('form > div:nth-of-type(1) select');
+if (typeSelect) { typeSelect.value = '1'; fire(typeSelect); }
+return new Promise((resolve) => {
+    const deadline = Date.now() + 5000;
+    const poll = () => {
+        const reason = document.getElementById('reason_ddl');
+        if (reason && !reason.disabled) {
+            reason.value = '2';
+            fire(reason);
+            return resolve({type: !!typeSelect, reason: true});
+        }
+        if (Date.now() > deadline) return resolve({type: !!typeSelect, reason: false});
+        setTimeout(poll, 50);
+    };
+    poll();
+});
+"""
+
+# True when a table row contains the (lower-cased) circuit number, case-insensitively
+ROW_PRESENT_SCRIPT = """
+const needle = arguments[0];
+const xpath = "//tr[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), "
+    + JSON.stringify(needle) + ")]";
+return !!document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+"""
+
 # ==================== ENUMERATIONS ====================
 
 class CancellationStatus(str, Enum):
@@ -63,16 +118,25 @@ class CancellationRequest(BaseModel):
     requested_date: Optional[str] = Field(None, description="Requested cancellation date")
     totp_code: Optional[str] = Field(None, description="Pre-generated TOTP from orchestrator")
 
-class ScreenshotData(BaseModel):
+@dataclass(slots=True)
+class ScreenshotData:
     """Screenshot data model"""
     name: str
     timestamp: datetime
-    data: str
+    data: Optional[str] = None
+    filepath: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "timestamp": self.timestamp.isoformat(), "base64_data": self.load_base64()}
     
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    def load_base64(self) -> Optional[str]:
+        """Base64 image, read back from disk on first use (blocking - call via asyncio.to_thread)"""
+        if self.data is None and self.filepath:
+            self.data = base64.b64encode(Path(self.filepath).read_bytes()).decode()
+        return self.data
 
-class ServiceData(BaseModel):
+@dataclass(slots=True)
+class ServiceData:
     """Service data model"""
     bitstream_reference: str
     status: ServiceStatus
@@ -81,8 +145,12 @@ class ServiceData(BaseModel):
     service_type: Optional[str] = None
     change_request_available: bool = False
     pending_requests_detected: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
-class CancellationResult(BaseModel):
+@dataclass(slots=True)
+class CancellationResult:
     """Cancellation result model"""
     job_id: str
     circuit_number: str
@@ -94,8 +162,24 @@ class CancellationResult(BaseModel):
     service_data: Optional[ServiceData] = None
     validation_results: Optional[Dict] = None
     execution_time: Optional[float] = None
-    screenshots: List[ScreenshotData] = []
+    screenshots: List[ScreenshotData] = field(default_factory=list)
     details: Optional[Dict] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "circuit_number": self.circuit_number,
+            "status": self.status.value,
+            "message": self.message,
+            "cancellation_submitted": self.cancellation_submitted,
+            "release_reference": self.release_reference,
+            "cancellation_timestamp": self.cancellation_timestamp,
+            "service_data": self.service_data.to_dict() if self.service_data else None,
+            "validation_results": self.validation_results,
+            "execution_time": self.execution_time,
+            "screenshots": [s.to_dict() for s in self.screenshots],
+            "details": self.details,
+        }
 
 # ==================== SCREENSHOT SERVICE ====================
 
@@ -107,6 +191,9 @@ class ScreenshotService:
         self.evidence_dir = Path(Config.get_job_screenshot_dir(job_id))
         self.evidence_dir.mkdir(parents=True, exist_ok=True)
         self.screenshots: List[ScreenshotData] = []
+        self._pending_shots: List[asyncio.Task] = []
+        self._prefix = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._seq = 0
         self.logger = logging.getLogger(self.__class__.__name__)
     
     async def take_screenshot(self, browser_client: BrowserServiceClient,
@@ -114,19 +201,22 @@ class ScreenshotService:
         """Take screenshot via browser service"""
         try:
             timestamp = datetime.now()
+            # Sequence is claimed before awaiting so concurrent shots never share a file
+            filename = f"{name}_{self._prefix}_{self._seq}.png"
+            self._seq += 1
             screenshot_b64 = await browser_client.screenshot(session_id, full_page=True)
             
             # Save to file
-            filename = f"{name}_{timestamp.strftime('%Y%m%d_%H%M%S')}.png"
             filepath = self.evidence_dir / filename
-            screenshot_bytes = base64.b64decode(screenshot_b64)
-            with open(filepath, 'wb') as f:
-                f.write(screenshot_bytes)
+            screenshot_bytes = await asyncio.to_thread(base64.b64decode, screenshot_b64)
+            del screenshot_b64
+            await asyncio.to_thread(filepath.write_bytes, screenshot_bytes)
+            del screenshot_bytes
             
             screenshot = ScreenshotData(
                 name=name,
                 timestamp=timestamp,
-                data=screenshot_b64
+                filepath=str(filepath)
             )
             
             self.screenshots.append(screenshot)
@@ -137,6 +227,21 @@ class ScreenshotService:
             self.logger.error(f"Failed to take screenshot: {str(e)}")
             return None
     
+    def schedule_screenshot(self, browser_client: BrowserServiceClient,
+                            session_id: str, name: str):
+        """Take screenshot in the background; call flush() before reading screenshots"""
+        self._pending_shots.append(
+            asyncio.create_task(self.take_screenshot(browser_client, session_id, name))
+        )
+    
+    async def flush(self):
+        """Wait for background screenshots and restore capture order"""
+        if not self._pending_shots:
+            return
+        await asyncio.gather(*self._pending_shots, return_exceptions=True)
+        self._pending_shots = []
+        self.screenshots.sort(key=lambda shot: shot.timestamp)
+    
     def get_all_screenshots(self) -> List[ScreenshotData]:
         """Get all screenshots"""
         return self.screenshots
@@ -155,6 +260,8 @@ class OctotelCancellationAutomation:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.screenshot_service: Optional[ScreenshotService] = None
         self.session_id: Optional[str] = None
+        self._totp = None
+        self._dom_cache: Optional[str] = None
     
     async def cancel_service(self, request: CancellationRequest) -> CancellationResult:
         """Main cancellation method"""
@@ -163,10 +270,23 @@ class OctotelCancellationAutomation:
         try:
             logger.info(f"Starting cancellation for job {request.job_id}, circuit {request.circuit_number}")
             
-            # Setup
-            self.screenshot_service = ScreenshotService(request.job_id)
-            self.session_id = await self.browser.create_session(int(request.job_id), headless=True)
-            
+            # Setup - local prep runs in a thread while the browser service creates the session
+            self._invalidated()
+            prep, session = await asyncio.gather(
+                asyncio.to_thread(self._prepare, request),
+                self.browser.create_session(int(request.job_id), headless=True),
+                return_exceptions=True
+            )
+            if not isinstance(session, BaseException):
+                self.session_id = session  # Set first so finally closes it if prep failed
+            for outcome in (session, prep):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            self.screenshot_service, totp = prep
+            if totp is not None:
+                self._totp = totp
+            
+            # Shots followed by a page-changing step are awaited so they show the named state
             await self.screenshot_service.take_screenshot(self.browser, self.session_id, "initial_state")
             
             # Login
@@ -182,26 +302,33 @@ class OctotelCancellationAutomation:
             await self.screenshot_service.take_screenshot(self.browser, self.session_id, "service_search")
             
             if search_result == SearchResult.ERROR:
+                await self.screenshot_service.flush()
                 return self._create_error_result(request, "Service search failed")
             
             if search_result == SearchResult.NOT_FOUND:
+                await self.screenshot_service.flush()
                 return self._create_not_found_result(request)
             
             # Check pending requests
             if service_data and service_data.pending_requests_detected:
+                await self.screenshot_service.flush()
                 return self._create_pending_requests_result(request, service_data)
             
-            # Submit cancellation
+            # Submit cancellation; from here on the page is only read, so shots run in the background
             success, release_reference = await self._submit_cancellation(request)
-            await self.screenshot_service.take_screenshot(self.browser, self.session_id, "cancellation_submitted")
+            self.screenshot_service.schedule_screenshot(self.browser, self.session_id, "cancellation_submitted")
             
             if not success:
+                await self.screenshot_service.flush()
                 return self._create_error_result(request, "Cancellation submission failed")
             
-            # Validate
-            validation_results = await self._validate_cancellation(request.circuit_number)
-            await self.screenshot_service.take_screenshot(self.browser, self.session_id, "validation_complete")
+            # Validate against the same post-submit snapshot the reference came from
+            validation_results = await self._validate_cancellation(
+                request.circuit_number, await self._page_content()
+            )
+            self.screenshot_service.schedule_screenshot(self.browser, self.session_id, "validation_complete")
             
+            await self.screenshot_service.flush()
             execution_time = time.time() - start_time
             
             result = CancellationResult(
@@ -225,10 +352,13 @@ class OctotelCancellationAutomation:
         except Exception as e:
             logger.error(f"Cancellation failed: {str(e)}")
             if self.screenshot_service and self.session_id:
+                await self.screenshot_service.flush()
                 await self.screenshot_service.take_screenshot(self.browser, self.session_id, "error_state")
             return self._create_error_result(request, str(e))
             
         finally:
+            if self.screenshot_service:
+                await self.screenshot_service.flush()
             if self.session_id:
                 await self.browser.close_session(self.session_id)
     
@@ -236,27 +366,23 @@ class OctotelCancellationAutomation:
         """Login to Octotel"""
         try:
             logger.info("Starting Octotel login")
-            await self.browser.navigate(self.session_id, Config.OCTOTEL_URL, wait_until="networkidle")
+            await self._navigate(Config.OCTOTEL_URL, wait_until="networkidle")
             
             # Click login
-            login_selectors = ["//a[contains(text(), 'Login')]", "#loginButton"]
-            for selector in login_selectors:
-                try:
-                    await self.browser.wait_for_selector(self.session_id, selector, timeout=10)
-                    await self.browser.click(self.session_id, selector)
-                    break
-                except:
-                    continue
+            if not await self._click_first(["//a[contains(text(), 'Login')]", "#loginButton"]):
+                logger.warning("Login button not found")
             
             # Wait for form
             await self.browser.wait_for_selector(self.session_id, "#signInFormUsername", timeout=10)
             
             # Enter credentials
-            await self.browser.type_text(self.session_id, "#signInFormUsername", Config.OCTOTEL_USERNAME)
-            await self.browser.type_text(self.session_id, "#signInFormPassword", Config.OCTOTEL_PASSWORD)
+            for selector, value in (("#signInFormUsername", Config.OCTOTEL_USERNAME),
+                                    ("#signInFormPassword", Config.OCTOTEL_PASSWORD)):
+                if not await self._set_value(selector, value):
+                    raise BrowserServiceError("Sign-in form fields not found")
             
             # Submit
-            await self.browser.click(self.session_id, "button[name='signInSubmitButton']")
+            await self._click("button[name='signInSubmitButton']")
             
             # TOTP
             await self._handle_totp(totp_code)
@@ -272,24 +398,35 @@ class OctotelCancellationAutomation:
         """Handle TOTP authentication"""
         try:
             if not totp_code:
-                import pyotp
-                totp = pyotp.TOTP(Config.OCTOTEL_TOTP_SECRET)
-                totp_code = totp.now()
+                # Code generated at the last moment so it cannot expire before use
+                totp_code = (self._totp or self._local_totp()).now()
                 logger.warning("Generated TOTP locally")
             
             await self.browser.wait_for_selector(self.session_id, "#totpCodeInput", timeout=12)
-            await self.browser.type_text(self.session_id, "#totpCodeInput", totp_code)
-            await self.browser.click(self.session_id, "#signInButton")
-            await self.browser.wait_for_timeout(self.session_id, 3000)
+            await self._type("#totpCodeInput", totp_code)
+            await self._click("#signInButton")
             
         except Exception as e:
             raise BrowserServiceError(f"TOTP failed: {str(e)}")
     
+    def _prepare(self, request: CancellationRequest):
+        """Blocking job setup: evidence directory and local TOTP generator"""
+        screenshot_service = ScreenshotService(request.job_id)
+        totp = None if request.totp_code else self._local_totp()
+        return screenshot_service, totp
+    
+    @staticmethod
+    def _local_totp():
+        """TOTP generator for when the orchestrator did not supply a code"""
+        if pyotp is None:
+            raise BrowserServiceError("pyotp is not installed and no TOTP code was supplied")
+        return pyotp.TOTP(Config.OCTOTEL_TOTP_SECRET)
+    
     async def _navigate_to_services(self):
         """Navigate to services page"""
         try:
-            await self.browser.click(self.session_id, "div.navbar li:nth-of-type(2) > a")
-            await self.browser.wait_for_timeout(self.session_id, 3000)
+            await self._click("div.navbar li:nth-of-type(2) > a")
+            await self.browser.wait_for_selector(self.session_id, "#search", timeout=10)
         except Exception as e:
             raise BrowserServiceError(f"Navigation failed: {str(e)}")
     
@@ -300,30 +437,26 @@ class OctotelCancellationAutomation:
             await self._configure_filters()
             
             # Search
-            await self.browser.type_text(self.session_id, "#search", circuit_number, clear=True)
+            await self._type("#search", circuit_number, clear=True)
             
             # Click search button
-            search_button_selectors = [
+            await self._click_first([
                 "//div[@class='app-body']//a[contains(text(), 'Search')]",
                 "//button[contains(text(), 'Search')]"
-            ]
-            for selector in search_button_selectors:
-                try:
-                    await self.browser.click(self.session_id, selector)
-                    break
-                except:
-                    continue
+            ])
             
-            await self.browser.wait_for_timeout(self.session_id, 5000)
+            await self._wait_for_network_idle()
             
             # Check if found
-            page_text = await self.browser.get_page_content(self.session_id)
-            if circuit_number.lower() not in page_text.lower():
+            found = await self.browser.execute_script(
+                self.session_id, ROW_PRESENT_SCRIPT, [circuit_number.lower()]
+            )
+            if not found:
                 return SearchResult.NOT_FOUND, None
             
             # Click service row
-            await self.browser.click(self.session_id, f"//tr[contains(., '{circuit_number}')]")
-            await self.browser.wait_for_timeout(self.session_id, 3000)
+            await self._click(f"//tr[contains(., '{circuit_number}')]")
+            await self._wait_for_network_idle()
             
             # Check change request availability
             change_request_available = await self._check_change_request_button()
@@ -344,15 +477,16 @@ class OctotelCancellationAutomation:
     async def _configure_filters(self):
         """Configure status filters"""
         try:
-            await self.browser.execute_script(
-                self.session_id,
+            await self._run_script(
                 """
                 let selects = document.querySelectorAll('select');
-                if (selects[0]) selects[0].value = '';
-                if (selects[2]) selects[2].value = '1';
+                for (const [i, value] of [[0, ''], [2, '1']]) {
+                    if (!selects[i]) continue;
+                    selects[i].value = value;
+                    selects[i].dispatchEvent(new Event('change', {bubbles: true}));
+                }
                 """
             )
-            await self.browser.wait_for_timeout(self.session_id, 1000)
         except:
             pass
     
@@ -370,13 +504,13 @@ class OctotelCancellationAutomation:
             if not await self._click_change_request():
                 return False, None
             
-            await self.browser.wait_for_timeout(self.session_id, 3000)
+            try:
+                await self.browser.wait_for_selector(self.session_id, "#reason_ddl", state="attached", timeout=10)
+            except BrowserServiceError as e:
+                logger.warning(f"Change request form not detected: {str(e)}")
             
-            # Set type to cancellation
-            await self._set_cancellation_type()
-            
-            # Set reason
-            await self._set_cancellation_reason()
+            # Set type to cancellation and reason
+            await self._apply_form_defaults()
             
             # Set date
             await self._set_cancellation_date(request.requested_date)
@@ -388,10 +522,11 @@ class OctotelCancellationAutomation:
             if not await self._submit_form():
                 return False, None
             
-            await self.browser.wait_for_timeout(self.session_id, 5000)
+            if not await self._wait_for_condition(SUBMIT_SETTLED_CONDITION, 10000):
+                logger.warning("No submission confirmation detected")
             
             # Extract reference
-            release_reference = await self._extract_release_reference()
+            release_reference = await self._extract_release_reference(await self._page_content())
             if not release_reference:
                 release_reference = f"AUTO_CR_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
@@ -404,32 +539,21 @@ class OctotelCancellationAutomation:
     async def _click_change_request(self) -> bool:
         """Click change request button"""
         try:
-            await self.browser.click(self.session_id, "createchangerequest > a")
+            await self._click("createchangerequest > a")
             return True
         except:
             return False
     
-    async def _set_cancellation_type(self):
-        """Set type to cancellation"""
+    async def _apply_form_defaults(self):
+        """Set cancellation type and reason in one script call"""
         try:
-            await self.browser.execute_script(
-                self.session_id,
-                "document.querySelector('form > div:nth-of-type(1) select').value = '1';"
-            )
-            await self.browser.wait_for_timeout(self.session_id, 1000)
+            applied = await self._run_script(FORM_DEFAULTS_SCRIPT) or {}
+            if not applied.get("type"):
+                logger.warning("Could not set type")
+            if not applied.get("reason"):
+                logger.warning("Could not set reason")
         except Exception as e:
-            logger.warning(f"Could not set type: {str(e)}")
-    
-    async def _set_cancellation_reason(self):
-        """Set cancellation reason"""
-        try:
-            await self.browser.execute_script(
-                self.session_id,
-                "document.getElementById('reason_ddl').value = '2';"
-            )
-            await self.browser.wait_for_timeout(self.session_id, 1000)
-        except Exception as e:
-            logger.warning(f"Could not set reason: {str(e)}")
+            logger.warning(f"Could not set type and reason: {str(e)}")
     
     async def _set_cancellation_date(self, requested_date: Optional[str]):
         """Set cancellation date"""
@@ -440,12 +564,9 @@ class OctotelCancellationAutomation:
                 future_date = datetime.now() + timedelta(days=30)
                 date_str = future_date.strftime("%d/%m/%Y")
             
-            # Find date input
-            date_inputs = await self.browser.query_all(self.session_id, "input[type='text']")
-            if date_inputs:
-                # Use first visible text input
-                await self.browser.type_text(self.session_id, "input[type='text']", date_str, clear=True)
-                logger.info(f"Set date: {date_str}")
+            # The date picker parses keystrokes, so type rather than assign the value
+            await self._type("input[type='text']", date_str, clear=True)
+            logger.info(f"Set date: {date_str}")
         except Exception as e:
             logger.warning(f"Could not set date: {str(e)}")
     
@@ -453,59 +574,47 @@ class OctotelCancellationAutomation:
         """Set comments"""
         try:
             comment = f"{self.CANCELLATION_COMMENT}. Reference: {solution_id}"
-            await self.browser.type_text(self.session_id, "textarea", comment, clear=True)
+            if not await self._set_value("textarea", comment):
+                logger.warning("Comments field not found")
         except Exception as e:
             logger.warning(f"Could not set comments: {str(e)}")
     
     async def _submit_form(self) -> bool:
         """Submit form"""
-        try:
-            submit_selectors = [
-                "div.modal-footer > button",
-                "//button[contains(text(), 'Submit')]",
-                "button[type='submit']"
-            ]
-            
-            for selector in submit_selectors:
-                try:
-                    await self.browser.click(self.session_id, selector)
-                    return True
-                except:
-                    continue
-            
-            return False
-        except:
-            return False
+        return await self._click_first([
+            "div.modal-footer > button",
+            "//button[contains(text(), 'Submit')]",
+            "button[type='submit']"
+        ]) is not None
     
-    async def _extract_release_reference(self) -> Optional[str]:
+    async def _extract_release_reference(self, page_source: Optional[str] = None) -> Optional[str]:
         """Extract release reference"""
         try:
-            page_source = await self.browser.get_page_content(self.session_id)
-            patterns = [r'(CR[\-_]?\d{6,})', r'(CHG[\-_]?\d{6,})', r'([A-Z]{2,3}\d{6,})']
-            for pattern in patterns:
-                matches = re.findall(pattern, page_source, re.IGNORECASE)
-                if matches:
-                    return matches[0].strip()
+            if page_source is None:
+                page_source = await self._page_content()
+            for pattern in _RELEASE_REF_PATTERNS:
+                match = pattern.search(page_source)
+                if match:
+                    return match.group(1).strip()
             return None
         except:
             return None
     
-    async def _validate_cancellation(self, circuit_number: str) -> Dict[str, Any]:
+    async def _validate_cancellation(self, circuit_number: str,
+                                     page_source: Optional[str] = None) -> Dict[str, Any]:
         """Validate cancellation submission"""
         try:
-            await self.browser.wait_for_timeout(self.session_id, 3000)
-            page_source = await self.browser.get_page_content(self.session_id)
-            
-            success_indicators = ["request submitted", "cancellation submitted", "successfully submitted"]
-            
-            for indicator in success_indicators:
-                if indicator in page_source.lower():
-                    return {
-                        "validation_timestamp": datetime.now().isoformat(),
-                        "validation_status": "complete",
-                        "cancellation_confirmed": True,
-                        "success_indicator": indicator
-                    }
+            if page_source is None:
+                page_source = await self._page_content()
+            
+            match = _SUCCESS_RE.search(page_source)
+            if match:
+                return {
+                    "validation_timestamp": datetime.now().isoformat(),
+                    "validation_status": "complete",
+                    "cancellation_confirmed": True,
+                    "success_indicator": match.group(0).lower()
+                }
             
             return {
                 "validation_timestamp": datetime.now().isoformat(),
@@ -515,29 +624,97 @@ class OctotelCancellationAutomation:
         except Exception as e:
             return {"error": str(e), "cancellation_confirmed": False}
     
+    def _invalidated(self):
+        """Forget the cached page content after anything that can change the DOM"""
+        self._dom_cache = None
+    
+    async def _page_content(self) -> str:
+        """Page HTML, fetched once per DOM state"""
+        if self._dom_cache is None:
+            self._dom_cache = await self.browser.get_page_content(self.session_id)
+        return self._dom_cache
+    
+    async def _navigate(self, url: str, **kwargs):
+        """Navigate, dropping the cached page content"""
+        self._invalidated()
+        return await self.browser.navigate(self.session_id, url, **kwargs)
+    
+    async def _click(self, selector: str, **kwargs):
+        """Click, dropping the cached page content"""
+        self._invalidated()
+        return await self.browser.click(self.session_id, selector, **kwargs)
+    
+    async def _type(self, selector: str, text: str, **kwargs):
+        """Type text, dropping the cached page content"""
+        self._invalidated()
+        return await self.browser.type_text(self.session_id, selector, text, **kwargs)
+    
+    async def _click_first(self, selectors: List[str], timeout: int = 10) -> Optional[str]:
+        """Click the first visible selector in one round-trip; returns the selector clicked"""
+        self._invalidated()
+        try:
+            index = await self.browser.click_first(self.session_id, selectors, timeout=timeout)
+        except BrowserServiceError as e:
+            logger.warning(f"Click failed for {selectors}: {str(e)}")
+            return None
+        return selectors[index] if index >= 0 else None
+    
+    async def _set_value(self, selector: str, value: str) -> bool:
+        """Fill a field in one call instead of per-keystroke typing; False if no match"""
+        self._invalidated()
+        return await self.browser.type_first(self.session_id, [selector], value) >= 0
+    
+    async def _run_script(self, script: str, args: List[Any] = None):
+        """Run a DOM-changing script"""
+        self._invalidated()
+        return await self.browser.execute_script(self.session_id, script, args)
+    
+    async def _wait_for_network_idle(self, timeout: int = 10):
+        """Wait for the page's requests to settle; carries on if it never does"""
+        self._invalidated()
+        try:
+            await self.browser.wait_for_load_state(self.session_id, "networkidle", timeout=timeout)
+        except BrowserServiceError as e:
+            logger.warning(f"Page did not settle: {str(e)}")
+    
+    async def _wait_for_condition(self, condition: str, timeout_ms: int) -> bool:
+        """Poll a page-side JS condition every 50ms; True if it held before the timeout"""
+        self._invalidated()
+        script = f"""
+        return new Promise((resolve) => {{
+            const deadline = Date.now() + {timeout_ms};
+            const poll = () => {{
+                let ok = false;
+                try {{ ok = !!({condition}); }} catch (e) {{}}
+                if (ok || Date.now() > deadline) return resolve(ok);
+                setTimeout(poll, 50);
+            }};
+            poll();
+        }});
+        """
+        try:
+            return bool(await self.browser.execute_script(self.session_id, script))
+        except BrowserServiceError as e:
+            logger.warning(f"Condition wait failed: {str(e)}")
+            return False
+    
     def _create_details_dict(self, submitted: bool, service_data: Optional[ServiceData],
                             validation: Dict, reference: Optional[str]) -> Dict:
         """Create details dictionary"""
-        details = {
+        return {
             "cancellation_submitted": submitted,
             "release_reference": reference,
             "found": service_data is not None,
             "cancellation_reason": self.CANCELLATION_REASON,
-            "cancellation_comment": self.CANCELLATION_COMMENT
-        }
-        
-        if service_data:
-            details.update({
+            "cancellation_comment": self.CANCELLATION_COMMENT,
+            **({
                 "circuit_number": service_data.bitstream_reference,
                 "service_status": service_data.status.value,
                 "change_request_available": service_data.change_request_available,
                 "pending_requests_detected": service_data.pending_requests_detected
-            })
-        
-        if validation:
-            details.update(validation)
-        
-        return details
+            } if service_data else {}),
+            **(validation or {})
+        }
     
     def _create_error_result(self, request: CancellationRequest, message: str) -> CancellationResult:
         """Create error result"""
@@ -614,6 +791,11 @@ async def execute(parameters: Dict[str, Any], browser_client: BrowserServiceClie
         automation = OctotelCancellationAutomation(browser_client)
         result = await automation.cancel_service(request)
         
+        # Hand the screenshots over so each payload is only held once while serializing
+        screenshots, result.screenshots = result.screenshots, []
+        # Read the evidence files back off the event loop before serializing
+        await asyncio.gather(*[asyncio.to_thread(s.load_base64) for s in screenshots])
+        
         results = {
             "status": "success" if result.status == CancellationStatus.SUCCESS else "failure",
             "message": result.message,
@@ -625,12 +807,14 @@ async def execute(parameters: Dict[str, Any], browser_client: BrowserServiceClie
                 "is_active": result.service_data.status != ServiceStatus.CANCELLED if result.service_data else False,
                 **(result.details or {})
             },
-            "screenshot_data": [
-                {"name": s.name, "timestamp": s.timestamp.isoformat(), "base64_data": s.data}
-                for s in result.screenshots
-            ]
+            "screenshot_data": [s.to_dict() for s in screenshots]
         }
         
+        # Re-validate for complete data only when the cancellation went through;
+        # failures and not-found circuits have nothing new to fetch
+        if result.status == CancellationStatus.SUCCESS and result.cancellation_submitted:
+            await _execute_validation_followup(job_id, circuit_number, browser_client, results)
+        
     except Exception as e:
         logger.error(f"Execute failed: {str(e)}")
         results = {
@@ -640,10 +824,6 @@ async def execute(parameters: Dict[str, Any], browser_client: BrowserServiceClie
             "screenshot_data": []
         }
     
-    finally:
-        # Execute validation for complete data
-        await _execute_validation_followup(job_id, circuit_number, browser_client, results)
-    
     return results
 
 
@@ -652,9 +832,11 @@ async def _execute_validation_followup(job_id: str, circuit_number: str,
                                        results: Dict):
     """Execute validation after cancellation"""
     try:
-        logger.info(f"Job {job_id}: Fetching updated data via validation")
+        if validation_execute is None:
+            logger.warning(f"Job {job_id}: Octotel validation unavailable, skipping followup")
+            return
         
-        from providers.octotel.validation import execute as validation_execute
+        logger.info(f"Job {job_id}: Fetching updated data via validation")
         
         validation_result = await validation_execute(
             {"job_id": job_id, "circuit_number": circuit_number, "totp_code": None},
@@ -7,6 +7,7 @@ Opens new tab, performs validation, closes tab, returns to original state.
 
 import os
 import time
+import asyncio
 import logging
 import traceback
 import json
@@ -14,13 +15,16 @@ import base64
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 
 from pydantic import BaseModel, Field
 
 from config import Config
-from browser_client import BrowserServiceClient, BrowserServiceError
+from browser_client import (
+    BrowserServiceClient, BrowserServiceError, b64codec,
+    SCREENSHOT_TYPE, SCREENSHOT_QUALITY, SCREENSHOT_EXTENSION
+)
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +34,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sidebar fields picked out by pattern, fused so the text is scanned once.
+# UUIDs are tried before phones so their digit runs are not reported as numbers.
+_SIDEBAR_FIELDS_RE = re.compile(
+    r"(?P<customer_email>[\w\.-]+@[\w\.-]+\.\w+)"
+    r"|(?P<service_uuid>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})"
+    r"|(?P<customer_phone>[\+]?[1-9]?[0-9]{7,14})",
+    re.IGNORECASE
+)
+
+# Table columns for each service detail, best source first
+_SERVICE_DETAIL_FIELDS = (
+    ("type", ("column_2", "service_type")),
+    ("speed_profile", ("column_8", "speed_profile")),
+    ("start_date", ("column_4", "start_date")),
+    ("isp_order_number", ("column_5", "isp_order_number")),
+)
+
+def _decode_and_write(screenshot_b64: str, path: Path):
+    """Decode and save a screenshot; runs on a worker thread"""
+    path.write_bytes(b64codec.b64decode(screenshot_b64))
+
 # ==================== ENUMERATIONS ====================
 
 class ValidationStatus(str, Enum):
@@ -65,10 +90,16 @@ class ScreenshotData(BaseModel):
     """Screenshot metadata and data container"""
     name: str
     timestamp: datetime
-    data: str  # Base64 encoded image
+    data: Optional[str] = None  # Base64 encoded image, only when held in memory
+    path: Optional[str] = None
     
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    def load_base64(self) -> Optional[str]:
+        """Base64 image, encoded from the evidence file only when serialized (blocking - call via asyncio.to_thread)"""
+        if self.data is not None:
+            return self.data
+        if self.path:
+            return b64codec.b64encode(Path(self.path).read_bytes()).decode()
+        return None
 
 class ServiceData(BaseModel):
     """Service information container"""
@@ -112,21 +143,22 @@ class ScreenshotService:
             timestamp = datetime.now()
             
             # Get screenshot from browser service
-            screenshot_b64 = await browser_client.screenshot(session_id, full_page=True)
+            screenshot_b64 = await browser_client.screenshot(
+                session_id, full_page=True,
+                image_type=SCREENSHOT_TYPE, quality=SCREENSHOT_QUALITY
+            )
             
             # Save to file
-            filename = f"{name}_{timestamp.strftime('%Y%m%d_%H%M%S')}.png"
+            filename = f"{name}_{timestamp.strftime('%Y%m%d_%H%M%S')}.{SCREENSHOT_EXTENSION}"
             filepath = self.evidence_dir / filename
             
-            # Decode and save
-            screenshot_bytes = base64.b64decode(screenshot_b64)
-            with open(filepath, 'wb') as f:
-                f.write(screenshot_bytes)
+            await asyncio.to_thread(_decode_and_write, screenshot_b64, filepath)
+            del screenshot_b64
             
-            screenshot = ScreenshotData(
+            screenshot = ScreenshotData.model_construct(
                 name=name,
                 timestamp=timestamp,
-                data=screenshot_b64
+                path=str(filepath)
             )
             
             self.screenshots.append(screenshot)
@@ -152,19 +184,23 @@ class StreamlinedDataProcessor:
     def create_streamlined_service_data(self, raw_table_data: Dict, raw_sidebar_data: Dict) -> Dict:
         """Create clean structured service data"""
         try:
-            service_id = self._get_best_value(raw_table_data, ["service_id", "column_0"])
-            line_reference = self._get_best_value(raw_table_data, ["line_reference", "column_1"])
+            gbv = self._get_best_value
+            exu = self._extract_uuids
+            service_id = gbv(raw_table_data, ("service_id", "column_0"))
+            line_reference = gbv(raw_table_data, ("line_reference", "column_1"))
+            service_uuids = exu(raw_sidebar_data, "service_uuid")
+            line_uuids = exu(raw_sidebar_data, "line_uuid")
             
             structured_service = {
                 "service_identifiers": {
                     "primary_id": service_id,
                     "line_reference": line_reference,
-                    "service_uuid": self._extract_uuids(raw_sidebar_data, "service_uuid"),
-                    "line_uuid": self._extract_uuids(raw_sidebar_data, "line_uuid")
+                    "service_uuid": service_uuids,
+                    "line_uuid": line_uuids
                 },
                 "customer_information": self._extract_customer_info(raw_table_data, raw_sidebar_data),
                 "service_details": self._extract_service_details(raw_table_data, raw_sidebar_data),
-                "technical_details": self._extract_technical_details(raw_table_data, raw_sidebar_data),
+                "technical_details": self._extract_technical_details(raw_table_data, service_uuids, line_uuids),
                 "location_information": self._extract_location_info(raw_table_data, raw_sidebar_data),
                 "status_information": self._extract_status_info(raw_table_data, raw_sidebar_data),
                 "change_requests": self.extract_change_requests_info(raw_sidebar_data),
@@ -177,8 +213,8 @@ class StreamlinedDataProcessor:
                 }
             }
             
-            completeness_fields = structured_service["data_completeness"]
-            structured_service["data_completeness"]["overall_score"] = sum(completeness_fields.values()) / len(completeness_fields)
+            cf = structured_service["data_completeness"]
+            cf["overall_score"] = sum(cf.values()) / len(cf)
             
             return structured_service
             
@@ -189,41 +225,34 @@ class StreamlinedDataProcessor:
     def _extract_customer_info(self, table_data: Dict, sidebar_data: Dict) -> Dict:
         """Extract customer information"""
         customer_info = {}
-        customer_name = self._get_best_value(table_data, ["column_6", "customer_name"])
+        customer_name = self._get_best_value(table_data, ("column_6", "customer_name"))
         if customer_name and not customer_name.startswith("S2"):
             customer_info["name"] = customer_name
         if sidebar_data.get("customer_email"):
-            customer_info["email"] = sidebar_data["customer_email"]
+            customer_info["email"] = sidebar_data["customer_email"][0]
         if sidebar_data.get("customer_phone"):
-            customer_info["phone"] = sidebar_data["customer_phone"]
+            customer_info["phone"] = sidebar_data["customer_phone"][0]
         return customer_info
     
     def _extract_service_details(self, table_data: Dict, sidebar_data: Dict) -> Dict:
         """Extract service details"""
         service_details = {}
-        field_mapping = {
-            "type": ["column_2", "service_type"],
-            "speed_profile": ["column_8", "speed_profile"],
-            "start_date": ["column_4", "start_date"],
-            "isp_order_number": ["column_5", "isp_order_number"]
-        }
-        for field_name, candidates in field_mapping.items():
+        for field_name, candidates in _SERVICE_DETAIL_FIELDS:
             value = self._get_best_value(table_data, candidates)
             if value:
                 service_details[field_name] = value
         return service_details
     
-    def _extract_technical_details(self, table_data: Dict, sidebar_data: Dict) -> Dict:
+    def _extract_technical_details(self, table_data: Dict, service_uuids: List[str],
+                                   line_uuids: List[str]) -> Dict:
         """Extract technical details"""
         technical_details = {}
-        network_node = self._get_best_value(table_data, ["column_9", "network_node"])
-        ont_device = self._get_best_value(table_data, ["column_10", "ont_device"])
+        network_node = self._get_best_value(table_data, ("column_9", "network_node"))
+        ont_device = self._get_best_value(table_data, ("column_10", "ont_device"))
         if network_node:
             technical_details["network_node"] = network_node
         if ont_device:
             technical_details["ont_device"] = ont_device
-        service_uuids = self._extract_uuids(sidebar_data, "service_uuid")
-        line_uuids = self._extract_uuids(sidebar_data, "line_uuid")
         if service_uuids:
             technical_details["service_uuid"] = service_uuids
         if line_uuids:
@@ -233,7 +262,7 @@ class StreamlinedDataProcessor:
     def _extract_location_info(self, table_data: Dict, sidebar_data: Dict) -> Dict:
         """Extract location information"""
         location_info = {}
-        address = self._get_best_value(table_data, ["column_7", "service_address"])
+        address = self._get_best_value(table_data, ("column_7", "service_address"))
         if address:
             location_info["address"] = address
         return location_info
@@ -241,7 +270,7 @@ class StreamlinedDataProcessor:
     def _extract_status_info(self, table_data: Dict, sidebar_data: Dict) -> Dict:
         """Extract status information"""
         status_info = {}
-        table_status = self._get_best_value(table_data, ["column_11", "table_status", "status"])
+        table_status = self._get_best_value(table_data, ("column_11", "table_status", "status"))
         if table_status:
             status_info["current_status"] = table_status
         sidebar_text = sidebar_data.get("raw_sidebar_text", "").lower()
@@ -251,19 +280,16 @@ class StreamlinedDataProcessor:
     
     def _extract_uuids(self, sidebar_data: Dict, uuid_type: str) -> List[str]:
         """Extract UUIDs"""
-        uuids = sidebar_data.get(uuid_type, [])
-        if isinstance(uuids, str):
-            return [uuids]
-        elif isinstance(uuids, list):
-            return list(set(uuids))
-        return []
+        return list(dict.fromkeys(sidebar_data.get(uuid_type) or []))
     
-    def _get_best_value(self, data: Dict, candidates: List[str]) -> str:
+    def _get_best_value(self, data: Dict, candidates: Tuple[str, ...]) -> str:
         """Get first non-empty value"""
         for candidate in candidates:
-            value = data.get(candidate, "")
-            if value and str(value).strip():
-                return str(value).strip()
+            value = data.get(candidate)
+            if value:
+                value = str(value).strip()
+                if value:
+                    return value
         return ""
     
     def extract_change_requests_info(self, service_details: Dict) -> Dict:
@@ -327,7 +353,7 @@ class OctotelValidationAutomation:
     
     async def validate_circuit(self, request: ValidationRequest) -> ValidationResult:
         """Main validation method with tab management"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"Starting validation for circuit {request.circuit_number}")
@@ -355,7 +381,6 @@ class OctotelValidationAutomation:
             
             # Search for circuit
             search_result = await self._search_for_circuit(request.circuit_number)
-            await self.screenshot_service.take_screenshot(self.browser, self.session_id, "search_completed")
             
             if search_result == SearchResult.ERROR:
                 return self._create_error_result(request, "Search operation failed")
@@ -366,21 +391,22 @@ class OctotelValidationAutomation:
             matching_services = search_data.get('matching_services', [])
             
             if search_result == SearchResult.NOT_FOUND:
-                return self._create_not_found_result(request, all_services, time.time() - start_time)
+                return self._create_not_found_result(request, all_services, time.perf_counter() - start_time)
             
-            # Extract detailed info
+            # Extract detailed info; one timestamp stamps the whole extraction
+            extracted_at = datetime.now().isoformat()
             service_details = {}
             if matching_services:
                 primary_service = matching_services[0]
                 service_id = primary_service.get('service_id', '')
                 
                 if await self._click_service_row(service_id):
-                    service_details = await self._extract_service_details(service_id)
+                    service_details = await self._extract_service_details(service_id, extracted_at)
                     await self.screenshot_service.take_screenshot(self.browser, self.session_id, "service_details")
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             result = self._create_streamlined_success_result(
-                request, all_services, matching_services, service_details, execution_time
+                request, all_services, matching_services, service_details, execution_time, extracted_at
             )
             
             logger.info(f"Validation completed successfully in {execution_time:.2f}s")
@@ -436,9 +462,11 @@ class OctotelValidationAutomation:
             # Wait for login form
             await self.browser.wait_for_selector(self.session_id, "#signInFormUsername", timeout=10)
             
-            # Enter credentials
-            await self.browser.type_text(self.session_id, "#signInFormUsername", Config.OCTOTEL_USERNAME)
-            await self.browser.type_text(self.session_id, "#signInFormPassword", Config.OCTOTEL_PASSWORD)
+            # Enter credentials - set directly rather than typed key by key
+            for selector, value in (("#signInFormUsername", Config.OCTOTEL_USERNAME),
+                                    ("#signInFormPassword", Config.OCTOTEL_PASSWORD)):
+                if await self.browser.type_first(self.session_id, [selector], value) < 0:
+                    raise BrowserServiceError("Sign-in form fields not found")
             
             # Submit
             await self.browser.click(self.session_id, "button[name='signInSubmitButton']")
@@ -478,7 +506,6 @@ class OctotelValidationAutomation:
             
             # Submit
             await self.browser.click(self.session_id, "#signInButton")
-            await self.browser.wait_for_timeout(self.session_id, 3000)
             
         except Exception as e:
             raise BrowserServiceError(f"TOTP authentication failed: {str(e)}")
@@ -488,7 +515,7 @@ class OctotelValidationAutomation:
         try:
             logger.info("Navigating to Services page")
             await self.browser.click(self.session_id, "div.navbar li:nth-of-type(2) > a")
-            await self.browser.wait_for_timeout(self.session_id, 3000)
+            await self.browser.wait_for_selector(self.session_id, "#search", timeout=10)
             logger.info("Navigated to Services")
         except Exception as e:
             raise BrowserServiceError(f"Failed to navigate to services: {str(e)}")
@@ -505,24 +532,29 @@ class OctotelValidationAutomation:
             await self.browser.type_text(self.session_id, "#search", circuit_number, clear=True)
             await self.browser.press_key(self.session_id, "Enter")
             
-            await self.browser.wait_for_timeout(self.session_id, 5000)
+            # Results are in once the search request settles
+            try:
+                await self.browser.wait_for_load_state(self.session_id, "networkidle", timeout=10)
+            except BrowserServiceError as e:
+                logger.warning(f"Search results did not settle: {str(e)}")
             
-            # Extract services
-            all_services = await self._extract_all_services()
+            # Extract services while the results are captured
+            all_services, _ = await asyncio.gather(
+                self._extract_all_services(),
+                self.screenshot_service.take_screenshot(self.browser, self.session_id, "search_completed")
+            )
             
             # Filter matching
-            matching_services = []
+            # One lowered key per service; the separator keeps a match from spanning fields
             search_term_lower = circuit_number.lower()
-            for service in all_services:
-                fields_to_check = [
-                    service.get("full_row_text", ""),
-                    service.get("service_id", ""),
-                    service.get("line_reference", "")
-                ]
-                for field_value in fields_to_check:
-                    if field_value and search_term_lower in str(field_value).lower():
-                        matching_services.append(service)
-                        break
+            matching_services = [
+                service for service in all_services
+                if search_term_lower in "\x1f".join((
+                    str(service.get("full_row_text") or ""),
+                    str(service.get("service_id") or ""),
+                    str(service.get("line_reference") or "")
+                )).lower()
+            ]
             
             self._search_results = {
                 'all_services': all_services,
@@ -546,11 +578,13 @@ class OctotelValidationAutomation:
                 self.session_id,
                 """
                 let selects = document.querySelectorAll('select');
-                if (selects[0]) selects[0].value = '';
-                if (selects[2]) selects[2].value = '1';
+                for (const [i, value] of [[0, ''], [2, '1']]) {
+                    if (!selects[i]) continue;
+                    selects[i].value = value;
+                    selects[i].dispatchEvent(new Event('change', {bubbles: true}));
+                }
                 """
             )
-            await self.browser.wait_for_timeout(self.session_id, 1000)
         except Exception as e:
             logger.warning(f"Could not set filters: {str(e)}")
     
@@ -578,36 +612,28 @@ class OctotelValidationAutomation:
         """Click service row"""
         try:
             await self.browser.click(self.session_id, f"//tr[contains(., '{service_id}')]")
-            await self.browser.wait_for_timeout(self.session_id, 2000)
+            await self.browser.wait_for_selector(self.session_id, ".sidebar", timeout=10)
             return True
         except:
             return False
     
-    async def _extract_service_details(self, service_id: str) -> Dict:
+    async def _extract_service_details(self, service_id: str, now_iso: Optional[str] = None) -> Dict:
         """Extract service details"""
         try:
-            await self.browser.wait_for_timeout(self.session_id, 2000)
-            
             # Get sidebar text
             sidebar_text = await self.browser.get_text(self.session_id, ".sidebar")
             
             service_details = {
-                "extraction_timestamp": datetime.now().isoformat(),
+                "extraction_timestamp": now_iso or datetime.now().isoformat(),
                 "raw_sidebar_text": sidebar_text,
                 "service_id": service_id
             }
             
             # Extract patterns
-            patterns = {
-                "customer_email": r"[\w\.-]+@[\w\.-]+\.\w+",
-                "customer_phone": r"[\+]?[1-9]?[0-9]{7,14}",
-                "service_uuid": r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
-            }
-            
-            for field_name, pattern in patterns.items():
-                matches = re.findall(pattern, sidebar_text, re.IGNORECASE)
-                if matches:
-                    service_details[field_name] = matches[0] if len(matches) == 1 else matches
+            hits: Dict[str, List[str]] = {}
+            for match in _SIDEBAR_FIELDS_RE.finditer(sidebar_text):
+                hits.setdefault(match.lastgroup, []).append(match.group())
+            service_details.update(hits)
             
             return service_details
             
@@ -616,7 +642,8 @@ class OctotelValidationAutomation:
     
     def _create_streamlined_success_result(self, request: ValidationRequest, all_services: List[Dict],
                                           matching_services: List[Dict], service_details: Dict,
-                                          execution_time: float) -> ValidationResult:
+                                          execution_time: float,
+                                          now_iso: Optional[str] = None) -> ValidationResult:
         """Create success result"""
         processor = StreamlinedDataProcessor(self.logger)
         
@@ -630,11 +657,11 @@ class OctotelValidationAutomation:
             "extraction_metadata": {
                 "total_services_found": len(matching_services),
                 "search_term": request.circuit_number,
-                "extraction_timestamp": datetime.now().isoformat()
+                "extraction_timestamp": now_iso or datetime.now().isoformat()
             }
         }
         
-        return ValidationResult(
+        return ValidationResult.model_construct(
             job_id=request.job_id,
             circuit_number=request.circuit_number,
             status=ValidationStatus.SUCCESS,
@@ -648,7 +675,7 @@ class OctotelValidationAutomation:
     
     def _create_error_result(self, request: ValidationRequest, message: str) -> ValidationResult:
         """Create error result"""
-        return ValidationResult(
+        return ValidationResult.model_construct(
             job_id=request.job_id,
             circuit_number=request.circuit_number,
             status=ValidationStatus.ERROR,
@@ -661,7 +688,7 @@ class OctotelValidationAutomation:
     def _create_not_found_result(self, request: ValidationRequest, all_services: List[Dict],
                                  execution_time: float) -> ValidationResult:
         """Create not found result"""
-        return ValidationResult(
+        return ValidationResult.model_construct(
             job_id=request.job_id,
             circuit_number=request.circuit_number,
             status=ValidationStatus.SUCCESS,
@@ -700,6 +727,11 @@ async def execute(parameters: Dict[str, Any], browser_client: BrowserServiceClie
         automation = OctotelValidationAutomation(browser_client)
         result = await automation.validate_circuit(request)
         
+        # Read the evidence files back off the event loop
+        images = await asyncio.gather(
+            *[asyncio.to_thread(screenshot.load_base64) for screenshot in result.screenshots]
+        )
+        
         # Convert to dictionary
         result_dict = {
             "status": result.status.value,
@@ -709,9 +741,9 @@ async def execute(parameters: Dict[str, Any], browser_client: BrowserServiceClie
                 {
                     "name": screenshot.name,
                     "timestamp": screenshot.timestamp.isoformat(),
-                    "base64_data": screenshot.data
+                    "base64_data": image
                 }
-                for screenshot in result.screenshots
+                for screenshot, image in zip(result.screenshots, images)
             ],
             "execution_time": result.execution_time
         }
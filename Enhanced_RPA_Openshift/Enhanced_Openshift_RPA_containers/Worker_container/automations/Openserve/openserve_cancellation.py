@@ -6,17 +6,20 @@ Refactored from OSN with strategy pattern, Forcepoint bypass, and validation fol
 
 import os
 import time
+import asyncio
 import logging
 import traceback
 import json
 import base64
+import re
+from dataclasses import dataclass, field, asdict
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 from abc import ABC, abstractmethod
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from config import Config
 from browser_client import BrowserServiceClient, BrowserServiceError
@@ -25,6 +28,17 @@ from browser_client import BrowserServiceClient, BrowserServiceError
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_ORDER_RE = re.compile(r'Order number[:\s]+#?(\d+)')
+
+# Runs _ORDER_RE over the rendered page text in the browser; returns the order number or null
+ORDER_NUMBER_SCRIPT = """
+const m = (document.body.innerText || '').match(new RegExp(arguments[0]));
+return m ? m[1] : null;
+"""
+
+# Caps concurrent cancellations (incl. validation followup) at the browser grid's session capacity
+_EXECUTE_SEM = asyncio.Semaphore(int(os.getenv("OSN_MAX_CONCURRENCY", "4")))
+
 # ==================== ENUMERATIONS ====================
 
 class CancellationStatus(str, Enum):
@@ -49,15 +63,25 @@ class CancellationRequest(BaseModel):
     solution_id: str
     requested_date: Optional[str] = None
 
-class ScreenshotData(BaseModel):
+# Internal results are built from already-validated data, so they are plain dataclasses
+
+@dataclass(slots=True)
+class ScreenshotData:
     name: str
     timestamp: datetime
-    data: str
+    data: bytes  # Raw image; encoded only when serialized
+    iso_timestamp: str = ""  # Formatted once at capture for the result payload
+    
+    def __post_init__(self):
+        if not self.iso_timestamp:
+            self.iso_timestamp = self.timestamp.isoformat()
     
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    @property
+    def base64_data(self) -> str:
+        return base64.b64encode(self.data).decode()
 
-class CancellationDetails(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class CancellationDetails:
     order_number: Optional[str] = None
     external_reference: str
     requested_date: Optional[str] = None
@@ -65,7 +89,8 @@ class CancellationDetails(BaseModel):
     status: str
     confirmation_received: bool = False
 
-class CancellationResult(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class CancellationResult:
     job_id: str
     circuit_number: str
     status: CancellationStatus
@@ -73,35 +98,74 @@ class CancellationResult(BaseModel):
     result_type: CancellationResultType
     cancellation_details: Optional[CancellationDetails] = None
     execution_time: Optional[float] = None
-    screenshots: List[ScreenshotData] = []
+    screenshots: List[ScreenshotData] = field(default_factory=list)
     error_details: Optional[Dict[str, Any]] = None
+    
+    def to_api_dict(self) -> Dict[str, Any]:
+        """Build the worker's job result payload"""
+        succeeded = self.status == CancellationStatus.SUCCESS
+        details = self.cancellation_details
+        return {
+            "status": "success" if succeeded else "failure",
+            "message": self.message,
+            "details": {
+                "found": succeeded,
+                "circuit_number": self.circuit_number,
+                "result_type": self.result_type.value,
+                "cancellation_status": self.status.value,
+                "execution_time": self.execution_time,
+                "cancellation_details": asdict(details) if details else None,
+                "cancellation_submitted": succeeded,
+                "cancellation_captured_id": details.order_number if details else None,
+                "service_found": True,
+                "is_active": self.status != CancellationStatus.ALREADY_CANCELLED
+            },
+            "screenshot_data": [
+                {"name": s.name, "timestamp": s.iso_timestamp, "base64_data": s.base64_data}
+                for s in self.screenshots
+            ]
+        }
 
 # ==================== SCREENSHOT SERVICE ====================
 
 class ScreenshotService:
     """Screenshot service"""
     
-    def __init__(self, job_id: str):
+    def __init__(self, job_id: str, persist: bool = True):
         self.job_id = job_id
+        self.persist = persist  # False keeps evidence in memory only
         self.screenshot_dir = Path(Config.get_job_screenshot_dir(job_id))
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
         self.screenshots: List[ScreenshotData] = []
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._write_queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+    
+    async def _drain(self):
+        """Write queued screenshots to disk off the capture path"""
+        while True:
+            filepath, screenshot_bytes = await self._write_queue.get()
+            try:
+                await asyncio.to_thread(filepath.write_bytes, screenshot_bytes)
+            except Exception as e:
+                self.logger.error(f"Screenshot write failed: {str(e)}")
+            finally:
+                self._write_queue.task_done()
     
     async def take_screenshot(self, browser_client: BrowserServiceClient,
                              session_id: str, name: str) -> Optional[ScreenshotData]:
         """Take screenshot"""
         try:
             timestamp = datetime.now()
-            screenshot_b64 = await browser_client.screenshot(session_id, full_page=True)
+            screenshot_bytes = await browser_client.screenshot_raw(session_id, full_page=True)
             
-            filename = f"{name}_{timestamp.strftime('%Y%m%d_%H%M%S')}.png"
-            filepath = self.screenshot_dir / filename
-            screenshot_bytes = base64.b64decode(screenshot_b64)
-            with open(filepath, 'wb') as f:
-                f.write(screenshot_bytes)
+            if self.persist:
+                filename = f"{name}_{timestamp.strftime('%Y%m%d_%H%M%S')}.png"
+                if self._drain_task is None:
+                    self._drain_task = asyncio.create_task(self._drain())
+                self._write_queue.put_nowait((self.screenshot_dir / filename, screenshot_bytes))
             
-            screenshot = ScreenshotData(name=name, timestamp=timestamp, data=screenshot_b64)
+            screenshot = ScreenshotData(name=name, timestamp=timestamp, data=screenshot_bytes)
             self.screenshots.append(screenshot)
             return screenshot
         except Exception as e:
@@ -110,6 +174,14 @@ class ScreenshotService:
     
     def get_all_screenshots(self) -> List[ScreenshotData]:
         return self.screenshots
+    
+    async def close(self):
+        """Wait for pending disk writes and stop the writer"""
+        if self._drain_task is None:
+            return
+        await self._write_queue.join()
+        self._drain_task.cancel()
+        self._drain_task = None
 
 # ==================== STRATEGY INTERFACES ====================
 
@@ -154,61 +226,75 @@ class IConfirmationStrategy(ABC):
 class StandardErrorDetectionStrategy(IErrorDetectionStrategy):
     """Standard error detection"""
     
+    _SELECTORS: Tuple[str, ...] = (
+        "//div[contains(@class, 'error')]",
+        "//div[contains(@class, 'alert-danger')]",
+        "//div[contains(@class, 'p-message-error')]"
+    )
+    
     async def has_error(self, browser: BrowserServiceClient, session_id: str) -> bool:
         try:
-            selectors = [
-                "//div[contains(@class, 'error')]",
-                "//div[contains(@class, 'alert-danger')]",
-                "//div[contains(@class, 'p-message-error')]"
-            ]
-            for selector in selectors:
-                if await browser.is_visible(session_id, selector, timeout=2):
-                    return True
-            return False
+            # Probe all selectors at once: one 2s timeout instead of one per selector
+            results = await asyncio.gather(
+                *[browser.is_visible(session_id, selector, timeout=2) for selector in self._SELECTORS],
+                return_exceptions=True
+            )
+            return any(result is True for result in results)
         except:
             return False
 
 class OpenserveAccessDeniedDetectionStrategy(IAccessDeniedDetectionStrategy):
     """Openserve access denied detection"""
     
+    _SELECTORS: Tuple[str, ...] = (
+        "//h1[contains(text(), 'Access Denied')]",
+        "//div[contains(text(), 'Access denied')]"
+    )
+    
     async def is_access_denied(self, browser: BrowserServiceClient, session_id: str) -> bool:
         try:
             url = await browser.get_current_url(session_id)
             if "error/access-denied" in url:
                 return True
             
-            selectors = [
-                "//h1[contains(text(), 'Access Denied')]",
-                "//div[contains(text(), 'Access denied')]"
-            ]
-            for selector in selectors:
-                if await browser.is_visible(session_id, selector, timeout=2):
-                    return True
-            return False
+            results = await asyncio.gather(
+                *[browser.is_visible(session_id, selector, timeout=2) for selector in self._SELECTORS],
+                return_exceptions=True
+            )
+            return any(result is True for result in results)
         except:
             return False
 
 class RobustFormInteractionStrategy(IFormInteractionStrategy):
     """Robust form interaction"""
     
+    _REFERENCE_SELECTORS: Tuple[str, ...] = (
+        "//input[@formcontrolname='reference']",
+        "input[formcontrolname='reference']",
+        "#externalReference"
+    )
+    _DATE_SELECTORS: Tuple[str, ...] = (
+        "p-calendar input",
+        "input[formcontrolname='ceaseDate']",
+        ".p-calendar input"
+    )
+    _SUBMIT_SELECTORS: Tuple[str, ...] = (
+        "//button[contains(@class, 'p-button') and .//span[text()='Submit']]",
+        "//button[contains(text(), 'Submit')]",
+        "button[type='submit']"
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
     
     async def fill_external_reference(self, browser: BrowserServiceClient, session_id: str, ref: str) -> bool:
         """Fill external reference"""
-        selectors = [
-            "//input[@formcontrolname='reference']",
-            "input[formcontrolname='reference']",
-            "#externalReference"
-        ]
-        
-        for selector in selectors:
-            try:
-                await browser.type_text(session_id, selector, ref, clear=True)
+        try:
+            if await browser.type_first(session_id, self._REFERENCE_SELECTORS, ref) >= 0:
                 self.logger.info(f"Filled external reference: {ref}")
                 return True
-            except:
-                continue
+        except BrowserServiceError as e:
+            self.logger.warning(f"Could not fill external reference: {str(e)}")
         
         return False
     
@@ -217,41 +303,29 @@ class RobustFormInteractionStrategy(IFormInteractionStrategy):
         if not date_str:
             return True
         
-        selectors = [
-            "p-calendar input",
-            "input[formcontrolname='ceaseDate']",
-            ".p-calendar input"
-        ]
-        
-        for selector in selectors:
+        formatted = self._format_date(date_str)
+        # p-calendar parses keystrokes, so type the value rather than assigning it
+        for selector in self._DATE_SELECTORS:
             try:
-                # Format date
-                formatted = self._format_date(date_str)
-                await browser.type_text(session_id, selector, formatted, clear=True)
+                await browser.type_text(session_id, selector, formatted, clear=True, timeout=5)
+                # Tab out so the calendar commits the typed value
                 await browser.press_key(session_id, "Tab")
                 await browser.wait_for_timeout(session_id, 1000)
                 self.logger.info(f"Filled date: {formatted}")
-                return True
-            except:
-                continue
+                break
+            except BrowserServiceError as e:
+                self.logger.warning(f"Could not fill date with {selector}: {str(e)}")
         
         return True  # Not critical
     
     async def submit_cancellation(self, browser: BrowserServiceClient, session_id: str) -> bool:
         """Submit form"""
-        selectors = [
-            "//button[contains(@class, 'p-button') and .//span[text()='Submit']]",
-            "//button[contains(text(), 'Submit')]",
-            "button[type='submit']"
-        ]
-        
-        for selector in selectors:
-            try:
-                await browser.click(session_id, selector)
+        try:
+            if await browser.click_first(session_id, self._SUBMIT_SELECTORS) >= 0:
                 self.logger.info("Submitted form")
                 return True
-            except:
-                continue
+        except BrowserServiceError as e:
+            self.logger.warning(f"Could not submit form: {str(e)}")
         
         return False
     
@@ -267,6 +341,14 @@ class RobustFormInteractionStrategy(IFormInteractionStrategy):
 class OpenserveConfirmationStrategy(IConfirmationStrategy):
     """Openserve confirmation handling"""
     
+    _DIALOG_SELECTOR = "//div[contains(@class, 'p-dialog')]"
+    _CONTINUE_SELECTORS: Tuple[str, ...] = (
+        "//button[@id='ceaseActiveServiceOrderSubmit']",
+        "//button[.//span[text()='Continue']]",
+        "//button[contains(text(), 'Continue')]"
+    )
+    _SUCCESS_HEADING = "//h1[contains(text(), 'submitted successfully')]"
+    
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
     
@@ -274,23 +356,13 @@ class OpenserveConfirmationStrategy(IConfirmationStrategy):
         """Handle confirmation dialog"""
         try:
             # Wait for dialog
-            await browser.wait_for_selector(session_id, "//div[contains(@class, 'p-dialog')]", timeout=10)
+            await browser.wait_for_selector(session_id, self._DIALOG_SELECTOR, timeout=10)
             self.logger.info("Dialog appeared")
             
             # Click continue
-            selectors = [
-                "//button[@id='ceaseActiveServiceOrderSubmit']",
-                "//button[.//span[text()='Continue']]",
-                "//button[contains(text(), 'Continue')]"
-            ]
-            
-            for selector in selectors:
-                try:
-                    await browser.click(session_id, selector)
-                    self.logger.info("Clicked Continue")
-                    return True
-                except:
-                    continue
+            if await browser.click_first(session_id, self._CONTINUE_SELECTORS) >= 0:
+                self.logger.info("Clicked Continue")
+                return True
             
             return False
         except Exception as e:
@@ -300,19 +372,21 @@ class OpenserveConfirmationStrategy(IConfirmationStrategy):
     async def extract_order_number(self, browser: BrowserServiceClient, session_id: str) -> Optional[str]:
         """Extract order number"""
         try:
-            await browser.wait_for_selector(
-                session_id,
-                "//h1[contains(text(), 'submitted successfully')]",
-                timeout=10
-            )
+            await browser.wait_for_selector(session_id, self._SUCCESS_HEADING, timeout=10)
             
-            # Extract order number
-            page_text = await browser.get_page_content(session_id)
-            
-            import re
-            match = re.search(r'Order number[:\s]+#?(\d+)', page_text)
+            # Extract order number from the confirmation container, whole page text as fallback
+            try:
+                page_text = await browser.get_text(session_id, f"{self._SUCCESS_HEADING}/..", timeout=5)
+            except BrowserServiceError:
+                page_text = ""
+            match = _ORDER_RE.search(page_text)
             if match:
                 order_number = match.group(1)
+            else:
+                # Match in the browser so only the number comes back, not the page HTML
+                order_number = await browser.execute_script(session_id, ORDER_NUMBER_SCRIPT, [_ORDER_RE.pattern])
+            if order_number:
+                order_number = str(order_number)
                 self.logger.info(f"Extracted order: {order_number}")
                 return order_number
             
@@ -335,7 +409,6 @@ class LoginPage:
         try:
             # Navigate with bypass
             await self.browser.navigate(self.session_id, "https://partners.openserve.co.za/login")
-            await self.browser.wait_for_timeout(self.session_id, 3000)
             
             # Handle Forcepoint
             page_source = await self.browser.get_page_content(self.session_id)
@@ -345,10 +418,8 @@ class LoginPage:
                     await self.browser.click(self.session_id, "//input[@value='   Visit Site anyway   ']")
                 except:
                     await self.browser.execute_script(self.session_id, "document.forms['ask'].submit();")
-                await self.browser.wait_for_timeout(self.session_id, 3000)
             
             # Wait for login page
-            await self.browser.wait_for_timeout(self.session_id, 5000)
             await self.browser.wait_for_selector(self.session_id, "#email", timeout=30)
             
             # Enter credentials
@@ -382,7 +453,6 @@ class CancellationPage:
         try:
             url = f"https://partners.openserve.co.za/active-services/{circuit_number}/cease-service"
             await self.browser.navigate(self.session_id, url)
-            await self.browser.wait_for_timeout(self.session_id, 3000)
             
             # Check for heading
             try:
@@ -403,7 +473,13 @@ class CancellationPage:
                                          requested_date: Optional[str] = None) -> tuple[bool, Optional[str]]:
         """Submit cancellation request"""
         try:
-            await self.browser.wait_for_timeout(self.session_id, 2000)
+            # The form renders after the heading; wait for its reference field
+            try:
+                await self.browser.wait_for_selector(
+                    self.session_id, "//input[@formcontrolname='reference']", state="attached", timeout=10
+                )
+            except BrowserServiceError as e:
+                self.logger.warning(f"Reference field not detected: {str(e)}")
             
             # Fill reference
             if not await self.form_strategy.fill_external_reference(self.browser, self.session_id, solution_id):
@@ -413,8 +489,6 @@ class CancellationPage:
             if requested_date:
                 await self.form_strategy.fill_cancellation_date(self.browser, self.session_id, requested_date)
             
-            await self.browser.wait_for_timeout(self.session_id, 2000)
-            
             # Submit
             if not await self.form_strategy.submit_cancellation(self.browser, self.session_id):
                 raise Exception("Failed to submit")
@@ -433,6 +507,106 @@ class CancellationPage:
             self.logger.error(f"Submission failed: {str(e)}")
             return False, None
 
+# ==================== SESSION POOL ====================
+
+class OpenserveSessionPool:
+    """
+    Logged-in Openserve portal sessions shared between jobs in this worker
+    
+    Sessions are keyed by login email. Released sessions are parked on
+    about:blank so no job's page stays open between jobs; on checkout they are
+    evicted if the TTL has lapsed or the session no longer answers. A portal
+    logout is only visible once the job navigates, so cancel_service evicts a
+    reused session that cannot reach its page and logs in again once.
+    """
+    
+    # Kept under the browser service's idle timeout so pooled sessions are still open
+    TTL = int(os.getenv("OSN_SESSION_TTL", "240"))
+    MAX_IDLE = int(os.getenv("OSN_SESSION_POOL_SIZE", "4"))
+    
+    # email -> queue of (session_id, login time)
+    _idle: Dict[str, asyncio.Queue] = {}
+    
+    @classmethod
+    def _queue(cls, email: str) -> asyncio.Queue:
+        if email not in cls._idle:
+            cls._idle[email] = asyncio.Queue(maxsize=cls.MAX_IDLE)
+        return cls._idle[email]
+    
+    @classmethod
+    async def acquire(cls, automation: "OpenserveCancellationAutomation", job_id: int) -> bool:
+        """
+        Give the automation a browser session
+        
+        Returns:
+            True if a logged-in pooled session was reused, False if a new one needs login
+        """
+        queue = cls._queue(Config.OSEMAIL)
+        while not queue.empty():
+            session_id, logged_in_at = queue.get_nowait()
+            if time.monotonic() - logged_in_at < cls.TTL and await cls._is_parked(automation.browser, session_id):
+                automation.session_id = session_id
+                automation._logged_in_at = logged_in_at
+                return True
+            # Expired or dead - evict
+            try:
+                await automation.browser.close_session(session_id)
+            except BrowserServiceError:
+                pass
+        
+        automation.session_id = await automation.browser.create_session(job_id, headless=True)
+        automation._logged_in_at = None
+        return False
+    
+    @classmethod
+    async def release(cls, automation: "OpenserveCancellationAutomation") -> bool:
+        """
+        Reset the automation's session to about:blank and return it to the pool
+        
+        Returns:
+            True if pooled, False if the caller should close the session
+        """
+        if not automation.session_id or automation._logged_in_at is None:
+            return False
+        queue = cls._queue(Config.OSEMAIL)
+        if queue.full():
+            return False
+        try:
+            await automation.browser.navigate(automation.session_id, "about:blank", wait_until="load")
+        except BrowserServiceError:
+            return False
+        try:
+            queue.put_nowait((automation.session_id, automation._logged_in_at))
+        except asyncio.QueueFull:
+            return False
+        automation.session_id = None
+        return True
+    
+    @classmethod
+    async def close_all(cls, browser_client: BrowserServiceClient) -> int:
+        """
+        Close every idle pooled session (worker shutdown)
+        
+        Returns:
+            Number of sessions closed
+        """
+        closed = 0
+        for queue in cls._idle.values():
+            while not queue.empty():
+                session_id, _ = queue.get_nowait()
+                await browser_client.close_session(session_id)
+                closed += 1
+        cls._idle.clear()
+        return closed
+    
+    @staticmethod
+    async def _is_parked(browser: BrowserServiceClient, session_id: str) -> bool:
+        """Cheap liveness probe - the session answers and is still on the blank page it was released on"""
+        try:
+            return await browser.get_current_url(session_id) == "about:blank"
+        except BrowserServiceError:
+            return False
+
 # ==================== MAIN AUTOMATION ====================
 
 class OpenserveCancellationAutomation:
@@ -452,47 +626,58 @@ class OpenserveCancellationAutomation:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.screenshot_service: Optional[ScreenshotService] = None
         self.session_id: Optional[str] = None
+        self._logged_in_at: Optional[float] = None
+        self._session_healthy = True
     
     async def cancel_service(self, request: CancellationRequest) -> CancellationResult:
         """Main cancellation method"""
         start_time = time.time()
+        screenshots: List[ScreenshotData] = []
         
         try:
             logger.info(f"Starting cancellation for {request.circuit_number}")
             
-            # Setup
+            # Setup - reuse a logged-in session when the pool has one
             self.screenshot_service = ScreenshotService(request.job_id)
-            self.session_id = await self.browser.create_session(int(request.job_id), headless=True)
-            
-            await self.screenshot_service.take_screenshot(self.browser, self.session_id, "initial")
-            
-            # Login
-            login_page = LoginPage(self.browser, self.session_id)
-            await login_page.login(Config.OSEMAIL, Config.OSPASSWORD)
-            await self.screenshot_service.take_screenshot(self.browser, self.session_id, "after_login")
+            screenshots = self.screenshot_service.get_all_screenshots()  # Live list, fills as we go
+            self._session_healthy = True
+            reused = await OpenserveSessionPool.acquire(self, int(request.job_id))
+            if reused:
+                logger.info("Reusing logged-in Openserve session")
+            else:
+                await self._login()
             
             # Navigate to cancellation
-            cancellation_page = CancellationPage(
-                self.browser,
-                self.session_id,
-                self.form_strategy,
-                self.confirmation_strategy
-            )
-            
-            if not await cancellation_page.navigate_to_cancellation(request.circuit_number):
+            cancellation_page = self._cancellation_page()
+            reached = await cancellation_page.navigate_to_cancellation(request.circuit_number)
+            
+            if (not reached and reused
+                    and not await self.access_strategy.is_access_denied(self.browser, self.session_id)):
+                # The portal login can expire before the pool TTL - evict and retry once with a fresh login
+                logger.info("Pooled Openserve session could not reach the cancellation page, logging in again")
+                evicted, self.session_id, self._logged_in_at = self.session_id, None, None
+                await self.browser.close_session(evicted)
+                self.session_id = await self.browser.create_session(int(request.job_id), headless=True)
+                await self._login()
+                cancellation_page = self._cancellation_page()
+                reached = await cancellation_page.navigate_to_cancellation(request.circuit_number)
+            
+            if not reached:
                 # Check if access denied (already cancelled)
                 if await self.access_strategy.is_access_denied(self.browser, self.session_id):
                     await self.screenshot_service.take_screenshot(self.browser, self.session_id, "access_denied")
-                    return self._create_already_cancelled_result(request)
+                    return self._create_already_cancelled_result(request, screenshots)
                 else:
-                    return self._create_error_result(request, "Failed to navigate to cancellation page")
-            
-            await self.screenshot_service.take_screenshot(self.browser, self.session_id, "cancellation_page")
+                    return self._create_error_result(request, screenshots, "Failed to navigate to cancellation page")
             
-            # Check errors
-            if await self.error_strategy.has_error(self.browser, self.session_id):
+            # Check errors while the page is captured; both only read the page
+            _, has_error = await asyncio.gather(
+                self.screenshot_service.take_screenshot(self.browser, self.session_id, "cancellation_page"),
+                self.error_strategy.has_error(self.browser, self.session_id)
+            )
+            if has_error:
                 await self.screenshot_service.take_screenshot(self.browser, self.session_id, "error_detected")
-                return self._create_error_result(request, "Error on cancellation page")
+                return self._create_error_result(request, screenshots, "Error on cancellation page")
             
             # Submit
             success, order_number = await cancellation_page.submit_cancellation_request(
@@ -502,22 +687,45 @@ class OpenserveCancellationAutomation:
             
             if success:
                 await self.screenshot_service.take_screenshot(self.browser, self.session_id, "success")
-                return self._create_success_result(request, order_number, start_time)
+                return self._create_success_result(request, screenshots, order_number, start_time)
             else:
                 await self.screenshot_service.take_screenshot(self.browser, self.session_id, "failed")
-                return self._create_error_result(request, "Submission failed")
+                return self._create_error_result(request, screenshots, "Submission failed")
             
         except Exception as e:
             logger.error(f"Cancellation failed: {str(e)}")
             if self.screenshot_service and self.session_id:
                 await self.screenshot_service.take_screenshot(self.browser, self.session_id, "error")
-            return self._create_error_result(request, str(e))
+            return self._create_error_result(request, screenshots, str(e))
             
         finally:
-            if self.session_id:
+            if self.screenshot_service:
+                await self.screenshot_service.close()
+            
+            # Healthy sessions go back to the pool parked on about:blank; the next job navigates to its own page
+            if self.session_id and not (self._session_healthy and await OpenserveSessionPool.release(self)):
                 await self.browser.close_session(self.session_id)
     
-    def _create_success_result(self, request: CancellationRequest, order_number: Optional[str], start_time: float) -> CancellationResult:
+    async def _login(self):
+        """Log the current session in to the portal"""
+        await self.screenshot_service.take_screenshot(self.browser, self.session_id, "initial")
+        
+        login_page = LoginPage(self.browser, self.session_id)
+        await login_page.login(Config.OSEMAIL, Config.OSPASSWORD)
+        self._logged_in_at = time.monotonic()
+        await self.screenshot_service.take_screenshot(self.browser, self.session_id, "after_login")
+    
+    def _cancellation_page(self) -> CancellationPage:
+        """Cancellation page object bound to the current session"""
+        return CancellationPage(
+            self.browser,
+            self.session_id,
+            self.form_strategy,
+            self.confirmation_strategy
+        )
+    
+    def _create_success_result(self, request: CancellationRequest, screenshots: List[ScreenshotData],
+                               order_number: Optional[str], start_time: float) -> CancellationResult:
         """Create success result"""
         execution_time = time.time() - start_time
         
@@ -538,10 +746,10 @@ class OpenserveCancellationAutomation:
             result_type=CancellationResultType.SUBMITTED,
             cancellation_details=details,
             execution_time=execution_time,
-            screenshots=self.screenshot_service.get_all_screenshots() if self.screenshot_service else []
+            screenshots=screenshots
         )
     
-    def _create_already_cancelled_result(self, request: CancellationRequest) -> CancellationResult:
+    def _create_already_cancelled_result(self, request: CancellationRequest, screenshots: List[ScreenshotData]) -> CancellationResult:
         """Create already cancelled result"""
         return CancellationResult(
             job_id=request.job_id,
@@ -549,18 +757,21 @@ class OpenserveCancellationAutomation:
             status=CancellationStatus.ALREADY_CANCELLED,
             message=f"Service {request.circuit_number} already cancelled",
             result_type=CancellationResultType.ALREADY_DEACTIVATED,
-            screenshots=self.screenshot_service.get_all_screenshots() if self.screenshot_service else []
+            screenshots=screenshots
         )
     
-    def _create_error_result(self, request: CancellationRequest, error_message: str) -> CancellationResult:
+    def _create_error_result(self, request: CancellationRequest, screenshots: List[ScreenshotData],
+                             error_message: str) -> CancellationResult:
         """Create error result"""
+        # A failed job may have left the session logged out or mid-form - never pool it
+        self._session_healthy = False
         return CancellationResult(
             job_id=request.job_id,
             circuit_number=request.circuit_number,
             status=CancellationStatus.ERROR,
             message=error_message,
             result_type=CancellationResultType.ERROR,
-            screenshots=self.screenshot_service.get_all_screenshots() if self.screenshot_service else [],
+            screenshots=screenshots,
             error_details={"error": error_message, "timestamp": datetime.now().isoformat()}
         )
 
@@ -585,6 +796,11 @@ class OpenserveCancellationFactory:
 
 async def execute(parameters: Dict[str, Any], browser_client: BrowserServiceClient) -> Dict[str, Any]:
     """Execute Openserve cancellation with validation followup"""
+    async with _EXECUTE_SEM:
+        return await _execute(parameters, browser_client)
+
+
+async def _execute(parameters: Dict[str, Any], browser_client: BrowserServiceClient) -> Dict[str, Any]:
     
     job_id = parameters.get("job_id")
     circuit_number = parameters.get("circuit_number")
@@ -613,28 +829,7 @@ async def execute(parameters: Dict[str, Any], browser_client: BrowserServiceClie
         
         # Execute
         result = await automation.cancel_service(request)
-        
-        # Convert to dict
-        results = {
-            "status": "success" if result.status == CancellationStatus.SUCCESS else "failure",
-            "message": result.message,
-            "details": {
-                "found": result.status == CancellationStatus.SUCCESS,
-                "circuit_number": result.circuit_number,
-                "result_type": result.result_type.value,
-                "cancellation_status": result.status.value,
-                "execution_time": result.execution_time,
-                "cancellation_details": result.cancellation_details.dict() if result.cancellation_details else None,
-                "cancellation_submitted": result.status == CancellationStatus.SUCCESS,
-                "cancellation_captured_id": result.cancellation_details.order_number if result.cancellation_details else None,
-                "service_found": True,
-                "is_active": result.status != CancellationStatus.ALREADY_CANCELLED
-            },
-            "screenshot_data": [
-                {"name": s.name, "timestamp": s.timestamp.isoformat(), "base64_data": s.data}
-                for s in result.screenshots
-            ]
-        }
+        results = result.to_api_dict()
         
     except Exception as e:
         logger.error(f"Execute failed: {str(e)}")
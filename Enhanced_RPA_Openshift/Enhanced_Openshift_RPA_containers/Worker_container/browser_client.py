@@ -7,12 +7,64 @@ Provides high-level methods for browser automation operations.
 
 import aiohttp
 import asyncio
+import base64
 import logging
-from typing import Dict, Any, Optional, List
+import os
+from typing import Dict, Any, Optional, List, Sequence
 from datetime import datetime
 
+try:
+    import pybase64 as b64codec  # SIMD base64 for large screenshots
+except ImportError:
+    b64codec = base64
+
 logger = logging.getLogger(__name__)
 
+# Evidence screenshot format shared by all automations; JPEG keeps evidence
+# legible at a fraction of the PNG size
+SCREENSHOT_TYPE = os.getenv("SCREENSHOT_TYPE", "jpeg")
+SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "70"))
+SCREENSHOT_EXTENSION = "jpg" if SCREENSHOT_TYPE == "jpeg" else SCREENSHOT_TYPE
+
+# Acts on the first visible match among the candidates (CSS, or XPath when it
+# starts with // or a bracket), polling until the deadline. Returns its index or -1.
+# args: [selectors, action ('click' | 'type'), text, timeout_ms]
+_FIRST_MATCH_SCRIPT = """
+const [selectors, action, text, timeoutMs] = arguments;
+const matches = (sel) => {
+    if (sel.startsWith('//') || sel.startsWith('(')) {
+        const snap = document.evaluate(sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: snap.snapshotLength}, (_, i) => snap.snapshotItem(i));
+    }
+    return Array.from(document.querySelectorAll(sel));
+};
+const act = () => {
+    for (let i = 0; i < selectors.length; i++) {
+        const el = matches(selectors[i]).find((m) => m.getClientRects().length > 0);
+        if (!el) continue;
+        if (action === 'click') {
+            el.click();
+        } else {
+            el.focus();
+            el.value = text;
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        return i;
+    }
+    return -1;
+};
+return new Promise((resolve) => {
+    const deadline = Date.now() + (timeoutMs || 0);
+    const poll = () => {
+        const index = act();
+        if (index >= 0 || Date.now() >= deadline) return resolve(index);
+        setTimeout(poll, 100);
+    };
+    poll();
+});
+"""
+
 
 class BrowserServiceError(Exception):
     """Browser service communication error"""
@@ -20,24 +72,49 @@ class BrowserServiceError(Exception):
 
 
 class BrowserServiceClient:
-    """Client for browser service REST API"""
+    """
+    Client for browser service REST API
+    
+    The worker creates one instance and hands it to every automation. Its
+    keep-alive pool carries every step of every job, so automations must
+    not create or close a client of their own.
+    """
     
-    def __init__(self, base_url: str, timeout: int = 300):
+    def __init__(self, base_url: str, timeout: int = 300,
+                 max_connections: int = 40, max_keepalive: int = 20):
         """
         Initialize browser service client
         
         Args:
             base_url: Base URL of browser service (e.g., http://rpa-browser-service:8080)
             timeout: Request timeout in seconds
+            max_connections: Maximum open connections to the browser service
+            max_keepalive: Maximum connections kept alive per host between calls
         """
         self.base_url = base_url.rstrip('/')
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=5)
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        """Get or create aiohttp session with a keep-alive connection pool"""
+        if self.session is not None and not self.session.closed:
+            return self.session
+        
+        # Concurrent first calls must not each open (and leak) their own pool
+        async with self._session_lock:
+            if self.session is None or self.session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_keepalive,
+                    keepalive_timeout=60
+                )
+                self.session = aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=connector
+                )
         return self.session
     
     async def close(self):
@@ -118,6 +195,50 @@ class BrowserServiceClient:
             logger.error(f"Failed to close session {session_id}: {str(e)}")
             return False
     
+    async def new_page(self, session_id: str) -> str:
+        """
+        Open an extra tab in an existing session
+        
+        The tab shares the session's cookies and login. The returned id is
+        accepted anywhere a session_id is.
+        
+        Returns:
+            page_id: Identifier for the new tab
+        """
+        result = await self._request("POST", f"/browser/{session_id}/pages")
+        return result.get("page_id")
+    
+    async def close_page(self, page_id: str) -> bool:
+        """Close a tab opened with new_page"""
+        try:
+            await self._request("DELETE", f"/browser/page/{page_id}")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to close page {page_id}: {str(e)}")
+            return False
+    
+    async def promote_page(self, page_id: str) -> Dict[str, Any]:
+        """
+        Make a tab opened with new_page its session's main page
+        
+        The session's old main page is closed and the session_id addresses
+        the tab from then on.
+        """
+        return await self._request("POST", f"/browser/page/{page_id}/promote")
+    
+    async def get_cookies(self, session_id: str) -> List[Dict[str, Any]]:
+        """Get all cookies of the session's browser context"""
+        result = await self._request("GET", f"/browser/{session_id}/cookies")
+        return result.get("cookies", [])
+    
+    async def set_cookies(self, session_id: str, cookies: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add cookies to the session's browser context"""
+        return await self._request(
+            "POST",
+            f"/browser/{session_id}/cookies",
+            json={"cookies": cookies}
+        )
+    
     # ========================================================================
     # Navigation
     # ========================================================================
@@ -223,6 +344,25 @@ class BrowserServiceClient:
             json={"selector": selector, "state": state, "timeout": timeout}
         )
     
+    async def wait_any(self, session_id: str, selectors: List[str], timeout: int = 30) -> int:
+        """
+        Wait for whichever of several elements becomes visible first
+        
+        Args:
+            session_id: Browser session ID
+            selectors: Candidate CSS selectors or XPaths
+            timeout: Wait timeout in seconds
+            
+        Returns:
+            Index of the first selector to appear, or -1 if none did in time
+        """
+        result = await self._request(
+            "POST",
+            f"/browser/{session_id}/wait_any",
+            json={"selectors": selectors, "timeout": timeout}
+        )
+        return result.get("index", -1)
+    
     async def get_text(self, session_id: str, selector: str, timeout: int = 30) -> str:
         """Get text content of element"""
         result = await self._request(
@@ -274,20 +414,76 @@ class BrowserServiceClient:
             json={"script": script, "args": args or []}
         )
     
-    async def screenshot(self, session_id: str, full_page: bool = False) -> str:
+    async def click_first(self, session_id: str, selectors: Sequence[str], timeout: float = 0) -> int:
+        """
+        Click the first visible element among several candidates in one call
+        
+        Args:
+            session_id: Browser session ID
+            selectors: Candidate CSS selectors or XPaths, in priority order
+            timeout: Seconds to keep polling for a visible candidate (0 checks once)
+        
+        Returns:
+            Index of the selector clicked, or -1 if none matched
+        """
+        result = await self.execute_script(
+            session_id, _FIRST_MATCH_SCRIPT, [list(selectors), "click", None, int(timeout * 1000)]
+        )
+        return result if isinstance(result, int) else -1
+    
+    async def type_first(self, session_id: str, selectors: Sequence[str], text: str,
+                         timeout: float = 0) -> int:
+        """
+        Set the value of the first visible field among several candidates in one call
+        
+        The value replaces any existing content and input/change events are
+        fired so framework-bound forms pick it up. Widgets that parse
+        keystrokes (e.g. date pickers) need type_text instead.
+        
+        Args:
+            session_id: Browser session ID
+            selectors: Candidate CSS selectors or XPaths, in priority order
+            text: Value to set
+            timeout: Seconds to keep polling for a visible candidate (0 checks once)
+        
+        Returns:
+            Index of the selector filled, or -1 if none matched
+        """
+        result = await self.execute_script(
+            session_id, _FIRST_MATCH_SCRIPT, [list(selectors), "type", text, int(timeout * 1000)]
+        )
+        return result if isinstance(result, int) else -1
+    
+    async def screenshot(self, session_id: str, full_page: bool = False,
+                         image_type: str = "png", quality: Optional[int] = None) -> str:
         """
         Take screenshot
         
+        Args:
+            session_id: Browser session ID
+            full_page: Capture the whole scrollable page
+            image_type: Image format (png, jpeg)
+            quality: JPEG quality 0-100 (ignored for png)
+        
         Returns:
             Base64 encoded screenshot
         """
+        payload = {"full_page": full_page, "type": image_type}
+        if quality is not None and image_type == "jpeg":
+            payload["quality"] = quality
         result = await self._request(
             "POST",
             f"/browser/{session_id}/screenshot",
-            json={"full_page": full_page}
+            json=payload
         )
         return result.get("screenshot", "")
     
+    async def screenshot_raw(self, session_id: str, full_page: bool = False,
+                             image_type: str = "png", quality: Optional[int] = None) -> bytes:
+        """Take screenshot and return the decoded image bytes"""
+        screenshot_b64 = await self.screenshot(session_id, full_page, image_type, quality)
+        return await asyncio.to_thread(b64codec.b64decode, screenshot_b64)
+    
     async def get_page_content(self, session_id: str) -> str:
         """Get page HTML content"""
         result = await self._request("GET", f"/browser/{session_id}/content")
@@ -332,6 +528,36 @@ class BrowserServiceClient:
             json={"timeout": timeout}
         )
     
+    async def wait_for_load_state(self, session_id: str, state: str = "networkidle", timeout: int = 30) -> Dict[str, Any]:
+        """
+        Wait for the page to reach a load state
+        
+        Args:
+            session_id: Browser session ID
+            state: Load state (load, domcontentloaded, networkidle)
+            timeout: Wait timeout in seconds
+        """
+        return await self._request(
+            "POST",
+            f"/browser/{session_id}/wait_load_state",
+            json={"state": state, "timeout": timeout}
+        )
+    
+    async def wait_for_url(self, session_id: str, url: str, timeout: int = 30) -> Dict[str, Any]:
+        """
+        Wait for the page URL to match
+        
+        Args:
+            session_id: Browser session ID
+            url: URL or glob pattern (e.g., **/main.php)
+            timeout: Wait timeout in seconds
+        """
+        return await self._request(
+            "POST",
+            f"/browser/{session_id}/wait_url",
+            json={"url": url, "timeout": timeout}
+        )
+    
     async def wait_for_timeout(self, session_id: str, milliseconds: int) -> Dict[str, Any]:
         """Wait for specified time"""
         return await self._request(
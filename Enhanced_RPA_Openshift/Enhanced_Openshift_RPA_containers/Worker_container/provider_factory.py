@@ -92,11 +92,17 @@ class BaseAutomation(ABC):
             await self.browser.close_session(self.session_id)
             self.session_id = None
     
-    async def take_screenshot(self, name: str = "screenshot") -> str:
+    async def take_screenshot(self, name: str = "screenshot", full_page: bool = True,
+                              image_type: str = "png", quality: Optional[int] = None) -> str:
         """Take screenshot and return base64 data"""
         if not self.session_id:
             raise AutomationError("No active session for screenshot")
-        return await self.browser.screenshot(self.session_id, full_page=True)
+        return await self.browser.screenshot(
+            self.session_id,
+            full_page=full_page,
+            image_type=image_type,
+            quality=quality
+        )
 
 
 # ============================================================================
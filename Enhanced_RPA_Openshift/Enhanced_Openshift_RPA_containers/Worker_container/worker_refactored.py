@@ -17,8 +17,11 @@ The worker:
 import os
 import sys
 import json
+import asyncio
 import logging
+import queue
 import traceback
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -26,6 +29,12 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
+
+try:
+    import orjson  # noqa: F401 - ORJSONResponse needs it at render time
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
 from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 
@@ -43,6 +52,7 @@ logging.basicConfig(
     level=getattr(logging, Config.LOG_LEVEL, logging.INFO),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+
 logger = logging.getLogger(__name__)
 
 # Global statistics
@@ -112,14 +122,59 @@ class HealthResponse(BaseModel):
 # FastAPI Application
 # ============================================================================
 
+# While the app runs, log records are written from a background thread so job
+# coroutines never block on log I/O
+_log_listener: Optional[QueueListener] = None
+_direct_log_handlers: list = []
+
+
+def start_log_listener():
+    """Route root log records through a queue drained by a listener thread"""
+    global _log_listener, _direct_log_handlers
+    root_logger = logging.getLogger()
+    _direct_log_handlers = root_logger.handlers[:]
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *_direct_log_handlers, respect_handler_level=True)
+    root_logger.handlers = [QueueHandler(log_queue)]
+    _log_listener.start()
+
+
+def stop_log_listener():
+    """Restore the direct handlers, then drain whatever is still queued"""
+    global _log_listener
+    if _log_listener is None:
+        return
+    logging.getLogger().handlers = _direct_log_handlers
+    _log_listener.stop()
+    _log_listener = None
+
+
+async def close_session_pools():
+    """Close the logged-in portal sessions parked in provider session pools"""
+    try:
+        from providers.mfn.validation import MFNSessionPool
+        closed = await MFNSessionPool.close_all(browser_client)
+        logger.info(f"Closed {closed} pooled MFN session(s)")
+    except ImportError:
+        pass
+    try:
+        from providers.osn.cancellation import OpenserveSessionPool
+        closed = await OpenserveSessionPool.close_all(browser_client)
+        logger.info(f"Closed {closed} pooled Openserve session(s)")
+    except ImportError:
+        pass
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
+    start_log_listener()
     logger.info("=" * 80)
     logger.info("RPA Worker Service Starting")
     logger.info("=" * 80)
     logger.info(f"Browser Service URL: {browser_client.base_url}")
     logger.info(f"Log Level: {Config.LOG_LEVEL}")
+    logger.info(f"Event Loop: {type(asyncio.get_running_loop()).__module__}")
     
     # Check browser service health
     if await browser_client.health_check():
@@ -130,13 +185,17 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("RPA Worker Service Shutting Down")
+    await close_session_pools()
+    await browser_client.close()
+    stop_log_listener()
 
 
 app = FastAPI(
     title="RPA Worker Service",
     description="Business logic execution layer for RPA platform",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
 
@@ -338,5 +397,6 @@ if __name__ == "__main__":
         host=host,
         port=port,
         log_level=Config.LOG_LEVEL.lower(),
+        loop="uvloop",  # libuv event loop, shipped with uvicorn[standard]
         access_log=True
     )
@@ -0,0 +1,81 @@
+"""
+Unit tests for worker services
+"""
+import pytest
+import asyncio
+import os
+from unittest.mock import MagicMock, patch
+
+# Import services to test
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+
+from browser_client import BrowserServiceClient
+
+
+class TestBrowserServiceClientPool:
+    """Tests for the BrowserServiceClient keep-alive connection pool"""
+
+    @pytest.fixture
+    def aiohttp_mocks(self):
+        """Patch aiohttp so each ClientSession/TCPConnector built is a distinct open mock"""
+        def new_session(*args, **kwargs):
+            session = MagicMock(name="ClientSession")
+            session.closed = False
+            session.connector = kwargs.get("connector")
+            return session
+
+        with patch("browser_client.aiohttp.TCPConnector",
+                   side_effect=lambda **kwargs: MagicMock(name="TCPConnector")) as connector_cls, \
+             patch("browser_client.aiohttp.ClientSession",
+                   side_effect=new_session) as session_cls:
+            yield connector_cls, session_cls
+
+    def test_session_and_connector_reused_across_calls(self, aiohttp_mocks):
+        """Test sequential calls share one ClientSession and its connector"""
+        connector_cls, session_cls = aiohttp_mocks
+        client = BrowserServiceClient("http://browser:8080")
+
+        async def run():
+            return [await client._get_session() for _ in range(5)]
+
+        sessions = asyncio.run(run())
+
+        assert all(session is sessions[0] for session in sessions)
+        assert all(session.connector is sessions[0].connector for session in sessions)
+        assert session_cls.call_count == 1
+        assert connector_cls.call_count == 1
+
+    def test_concurrent_first_calls_create_one_session(self, aiohttp_mocks):
+        """Test concurrent first calls do not each open their own pool"""
+        connector_cls, session_cls = aiohttp_mocks
+        client = BrowserServiceClient("http://browser:8080")
+
+        async def run():
+            return await asyncio.gather(*(client._get_session() for _ in range(20)))
+
+        sessions = asyncio.run(run())
+
+        assert len({id(session) for session in sessions}) == 1
+        assert session_cls.call_count == 1
+        assert connector_cls.call_count == 1
+
+    def test_closed_session_is_replaced(self, aiohttp_mocks):
+        """Test a new pool is opened only after the shared one was closed"""
+        connector_cls, session_cls = aiohttp_mocks
+        client = BrowserServiceClient("http://browser:8080")
+
+        async def run():
+            first = await client._get_session()
+            first.closed = True
+            return first, await client._get_session()
+
+        first, second = asyncio.run(run())
+
+        assert second is not first
+        assert session_cls.call_count == 2
+        assert connector_cls.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])